@@ -3,6 +3,7 @@
 # requires-python = ">=3.10"
 # dependencies = [
 #     "colorama>=0.4.6",
+#     "orjson>=3.9",
 # ]
 # ///
 """
@@ -48,21 +49,30 @@ Then use:
 
 from __future__ import annotations
 
-import argparse
+import hashlib
 import json
 import os
 import re
+import select
 import signal
 import subprocess
 import sys
 import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from colorama import Fore, Style, init
 
-# Initialize colorama
-init()
+try:
+    # orjson parses the raw stream-json bytes directly and is several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Color mapping for stages
 STAGE_COLORS = {
@@ -79,6 +89,15 @@ STAGE_COLORS = {
     'Commit': Fore.GREEN,
 }
 
+# Lines of output kept in memory when a command's transcript goes to a log file
+OUTPUT_TAIL_LINES = 200
+
+# How far from the end of a transcript to look for a completion sentinel
+SENTINEL_SCAN_CHARS = 16384
+
+# Session id carried by stream-json events (init and result)
+_SESSION_ID_RE = re.compile(r'"session_id"\s*:\s*"([0-9A-Za-z-]+)"')
+
 # Map index file suffixes to indexer scripts
 INDEXER_MAP = {
     '_py.md': 'index_python.py',
@@ -113,6 +132,8 @@ class ImplementConfig:
     max_turns: int = 40
     max_fix_iterations: int = 5
     max_review_cycles: int = 3
+    index_max_age: int = 3600  # Reuse a codebase index up to this old (seconds, 0 = always re-index)
+    exec_handoff: bool = False  # Replace this process with the handoff session (nothing runs after it)
     plan_path: str = ''
     research_path: str = ''
     test_cmd: str = ''
@@ -150,22 +171,45 @@ class QueryRefinementResult:
 
 # --- Utility functions ---
 
+_SEPARATOR = f"{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}"
+
+# Implement phase summary block, filled in with str.format()
+_IMPLEMENT_SUMMARY = (
+    f"\n{_SEPARATOR}\n"
+    f"\n{Fore.GREEN}{Style.BRIGHT}  Implement Summary{Style.RESET_ALL}\n\n"
+    "  Status:           {status}\n"
+    "  Review cycles:    {review_cycles}\n"
+    "  Commits made:     {commits}\n"
+    "  Pre-implement:    {pre_commit:.8}\n"
+    "  Current HEAD:     {current_commit:.8}\n"
+    f"\n{_SEPARATOR}\n\n"
+)
+
+# "[Stage] " prefixes keyed by (stage, color), built on first use
+_progress_prefixes: dict[tuple[str, str], str] = {}
+
+
 def print_phase_header(phase_name: str) -> None:
     """Print a prominent phase header with separators."""
     color = STAGE_COLORS.get(phase_name, Fore.WHITE)
-    print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}", file=sys.stderr, flush=True)
-    print(f"\n{color}Starting Phase: {phase_name}{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
-    print(f"{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
+    sys.stderr.write(f"\n{_SEPARATOR}\n\n{color}Starting Phase: {phase_name}{Style.RESET_ALL}\n\n"
+                     f"{_SEPARATOR}\n\n")
+    sys.stderr.flush()
 
 
 def stream_progress(stage: str, message: str) -> None:
     """Print progress update to stderr for real-time feedback."""
-    color = STAGE_COLORS.get(stage, Fore.WHITE)
     if 'FAILED' in message:
         color = Fore.RED
     elif 'Complete' in message:
         color = Fore.GREEN
-    print(f"{color}[{stage}]{Style.RESET_ALL} {message}", file=sys.stderr, flush=True)
+    else:
+        color = STAGE_COLORS.get(stage, Fore.WHITE)
+    prefix = _progress_prefixes.get((stage, color))
+    if prefix is None:
+        prefix = _progress_prefixes[(stage, color)] = f"{color}[{stage}]{Style.RESET_ALL} "
+    sys.stderr.write(prefix + message + '\n')
+    sys.stderr.flush()
 
 
 def format_duration(seconds: float) -> str:
@@ -177,12 +221,41 @@ def format_duration(seconds: float) -> str:
     return f"{minutes}m {secs:.1f}s"
 
 
-def format_stream_event(line: str) -> str | None:
+# Tool input keys that get the longer preview limit
+_LONG_KEYS = frozenset(('file_path', 'path', 'pattern'))
+
+
+def _truncate_value(value: object, limit: int) -> str:
+    """Render a tool input value, cut to limit characters plus '...'."""
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def format_cache_usage(usage: dict | None) -> str:
+    """Summarize prompt-cache hits from a result event's usage block.
+
+    Claude Code caches the stable prompt prefix itself; this makes the hit rate
+    visible per phase. Returns '' when there is no usage data.
+    """
+    if not usage:
+        return ''
+    cache_read = usage.get('cache_read_input_tokens') or 0
+    total_input = ((usage.get('input_tokens') or 0)
+                   + (usage.get('cache_creation_input_tokens') or 0)
+                   + cache_read)
+    if not total_input:
+        return ''
+    return (f" {Fore.WHITE}({total_input:,} input tokens, "
+            f"{cache_read / total_input:.0%} from prompt cache){Style.RESET_ALL}")
+
+
+def format_stream_event(line: bytes) -> str | None:
     """Parse a stream-json line and return a human-readable string, or None to skip."""
     try:
-        event = json.loads(line)
-    except json.JSONDecodeError:
-        return line.strip() if line.strip() else None
+        event = json_loads(line)
+    except ValueError:
+        text = line.decode('utf-8', 'replace').strip()
+        return text if text else None
 
     event_type = event.get('type')
 
@@ -205,15 +278,11 @@ def format_stream_event(line: str) -> str | None:
                 tool_input = item.get('input', {})
                 # Show brief input summary
                 if isinstance(tool_input, dict):
-                    input_parts = []
-                    for k, v in list(tool_input.items())[:3]:
-                        v_str = str(v)
-                        # Longer limit for file paths, shorter for other values
-                        max_len = 80 if k in ('file_path', 'path', 'pattern') else 50
-                        if len(v_str) > max_len:
-                            v_str = v_str[:max_len] + '...'
-                        input_parts.append(f"{k}={v_str}")
-                    input_summary = ', '.join(input_parts)
+                    # Longer limit for file paths, shorter for other values
+                    input_summary = ', '.join(
+                        f"{k}={_truncate_value(v, 80 if k in _LONG_KEYS else 50)}"
+                        for k, v in islice(tool_input.items(), 3)
+                    )
                 else:
                     input_summary = str(tool_input)[:100]
                 parts.append(f"  {Fore.CYAN}→ {tool_name}{Style.RESET_ALL}({input_summary})")
@@ -225,8 +294,8 @@ def format_stream_event(line: str) -> str | None:
         for item in content:
             if item.get('type') == 'tool_result':
                 result = str(item.get('content', ''))
-                # Show first 2 lines, truncated
-                lines = result.split('\n')[:2]
+                # Show first 2 lines, truncated (don't split the whole result)
+                lines = result.split('\n', 2)[:2]
                 preview = ' | '.join(line.strip() for line in lines if line.strip())[:150]
                 if preview:
                     suffix = '...' if len(result) > 150 else ''
@@ -237,22 +306,96 @@ def format_stream_event(line: str) -> str | None:
     if event_type == 'result':
         result_text = event.get('result', '')
         if result_text:
-            # Show first 3 lines max
-            lines = result_text.strip().split('\n')[:3]
-            preview = '\n'.join(lines)
-            suffix = '\n...' if len(result_text.split('\n')) > 3 else ''
-            return f"\n{Fore.GREEN}✓ Done{Style.RESET_ALL}\n"
+            return f"\n{Fore.GREEN}✓ Done{Style.RESET_ALL}{format_cache_usage(event.get('usage'))}\n"
         return None
 
     return None
 
 
-def run_claude_command(command: list[str], cwd: str, timeout: int = 600, phase: str = '') -> tuple[int, str, float]:
+# (signal name, exit code) recorded by main()'s SIGTERM/SIGINT handler. Outside a
+# streaming run the handler exits straight away; while run_claude_command() has a
+# child in its own process group (_defer_shutdown), it only records the request
+# and the streaming loop stops the group and exits at its next tick.
+_shutdown_request: tuple[str, int] | None = None
+_defer_shutdown = False
+
+
+def terminate_process_group(process: subprocess.Popen, grace: float = 10) -> None:
+    """Stop a child started with start_new_session=True, and everything under it.
+
+    claude-safe runs claude as its own child, so signalling only the wrapper
+    pid can leave claude still writing its session transcript. SIGTERM the
+    whole process group, wait up to grace seconds for every member to exit,
+    then SIGKILL whatever is left.
+    """
+    def signal_group(sig: int) -> bool:
+        try:
+            os.killpg(process.pid, sig)
+            return True
+        except ProcessLookupError:
+            return False
+
+    signal_group(signal.SIGTERM)
+    deadline = time.monotonic() + grace
+    try:
+        process.wait(timeout=grace)
+        # The wrapper is gone; give the rest of the group the remaining time
+        while signal_group(0) and time.monotonic() < deadline:
+            time.sleep(0.1)
+    except subprocess.TimeoutExpired:
+        pass
+    signal_group(signal.SIGKILL)
+    process.wait()  # Reap the process to avoid zombies
+
+
+def exit_if_shutdown_requested(process: subprocess.Popen | None = None) -> None:
+    """Exit if a shutdown signal arrived, stopping process first so no claude-safe child is orphaned."""
+    if _shutdown_request is None:
+        return
+    if process is not None and process.poll() is None:
+        terminate_process_group(process)
+    sig_name, exit_code = _shutdown_request
+    print(f"\n{sig_name} received, shutting down...", file=sys.stderr)
+    sys.exit(exit_code)
+
+
+class CommandTimeout(RuntimeError):
+    """A run_claude_command() run hit its wall-clock timeout and was stopped."""
+
+
+def run_claude_command(command: list[str], cwd: str, timeout: int = 600, phase: str = '',
+                       log_path: Path | None = None,
+                       stop_when: Callable[[bytes], bool] | None = None) -> tuple[int, str, float]:
     """Run a Claude Code command with real-time output streaming.
 
+    If log_path is given, the raw transcript is written there as it arrives and
+    only the last OUTPUT_TAIL_LINES lines are kept in memory and returned.
+    If stop_when returns True for an output line, the command is terminated
+    there instead of being left to finish its remaining turns.
+    timeout is a wall-clock limit on the whole run; reaching it stops the
+    command and raises CommandTimeout.
+
     Returns:
         Tuple of (return_code, captured_output, elapsed_seconds)
     """
+    global _defer_shutdown
+    exit_if_shutdown_requested()
+    # The child gets its own process group, so terminal signals no longer reach
+    # it: hold SIGTERM/SIGINT as a request until it has been stopped
+    _defer_shutdown = True
+    try:
+        result = _stream_claude_command(command, cwd, timeout, phase, log_path, stop_when)
+    finally:
+        _defer_shutdown = False
+    # A request that arrived after the loop's last tick
+    exit_if_shutdown_requested()
+    return result
+
+
+def _stream_claude_command(command: list[str], cwd: str, timeout: int, phase: str,
+                           log_path: Path | None,
+                           stop_when: Callable[[bytes], bool] | None) -> tuple[int, str, float]:
+    """Body of run_claude_command(), run with shutdown requests deferred."""
     # Use stream-json with verbose for real-time output in -p mode
     command = command.copy()
     command.insert(1, '--verbose')
@@ -262,36 +405,82 @@ def run_claude_command(command: list[str], cwd: str, timeout: int = 600, phase:
     # Print phase header if provided
     if phase:
         print_phase_header(phase)
+    # Opened before the child starts, so a failure here can't leave it running
+    log_file = log_path.open('wb') if log_path else None
     start_time = time.time()
-    process = subprocess.Popen(
-        command,
-        cwd=cwd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
-    )
-
-    output_lines = []
+    # The timeout covers the whole run, including the time spent streaming output
+    deadline = time.monotonic() + timeout
     try:
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            # Own process group, so stopping it reaches claude under claude-safe
+            start_new_session=True,
+        )
+    except BaseException:
+        if log_file:
+            log_file.close()
+        raise
+
+    # Read raw chunks and split lines ourselves: stream-json is chatty, and the
+    # text layer would decode and buffer every event line by line.
+    output_lines: list[bytes] | deque[bytes] = deque(maxlen=OUTPUT_TAIL_LINES) if log_path else []
+    try:
+        stopped = False
         if process.stdout:
-            for line in process.stdout:
-                output_lines.append(line)
-                formatted = format_stream_event(line)
+            fd = process.stdout.fileno()
+            buf = bytearray()
+            while not stopped:
+                # The 0.5s select tick bounds how long a shutdown request waits
+                exit_if_shutdown_requested(process)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                ready, _, _ = select.select([fd], [], [], min(remaining, 0.5))
+                if not ready:
+                    continue
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                if log_file:
+                    log_file.write(chunk)
+                buf += chunk
+                *lines, partial = buf.split(b'\n')
+                buf = bytearray(partial)
+                for line in lines:
+                    output_lines.append(line + b'\n')
+                    formatted = format_stream_event(line)
+                    if formatted:
+                        print(formatted, file=sys.stderr, flush=True)
+                    if stop_when and stop_when(line):
+                        stopped = True
+                        break
+            if buf and not stopped:
+                output_lines.append(bytes(buf))
+                formatted = format_stream_event(bytes(buf))
                 if formatted:
                     print(formatted, file=sys.stderr, flush=True)
 
-        process.wait(timeout=timeout)
+        if stopped:
+            # Wait for the whole group, so a resumed session finds a finished transcript
+            terminate_process_group(process)
+        else:
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
     except subprocess.TimeoutExpired:
-        process.kill()
-        process.wait()  # Reap the process to avoid zombies
+        terminate_process_group(process, grace=0)
         elapsed = time.time() - start_time
-        raise RuntimeError(f"Command timed out after {format_duration(elapsed)}")
+        raise CommandTimeout(f"Command timed out after {format_duration(elapsed)}")
+    finally:
+        if log_file:
+            log_file.close()
 
     elapsed = time.time() - start_time
     # Fallback to 1 if returncode is None (shouldn't happen after wait())
     returncode = process.returncode if process.returncode is not None else 1
-    return returncode, ''.join(output_lines), elapsed
+    return returncode, b''.join(output_lines).decode('utf-8', 'replace'), elapsed
 
 
 def run_claude_interactive(prompt: str, cwd: str) -> int:
@@ -349,13 +538,35 @@ def find_codebase_index(project_path: str) -> str | None:
     if not codebase_dir.exists():
         return None
 
-    # Find all overview files
-    index_files = list(codebase_dir.glob('codebase_overview_*.md'))
-    if not index_files:
-        return None
-
-    # Return the most recently modified one
-    return str(max(index_files, key=lambda f: f.stat().st_mtime))
+    # Return the most recently modified overview file; scandir entries carry their stat
+    newest = None
+    newest_mtime = -1.0
+    with os.scandir(codebase_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('codebase_overview_') and entry.name.endswith('.md'):
+                mtime = entry.stat().st_mtime
+                if mtime > newest_mtime:
+                    newest, newest_mtime = entry.path, mtime
+    return newest
+
+
+def codebase_index_is_fresh(index_path: str | None, project_path: str, max_age: float) -> bool:
+    """Check whether index_path postdates the HEAD commit and is at most max_age seconds old."""
+    if not index_path or max_age <= 0:
+        return False
+    try:
+        index_mtime = os.stat(index_path).st_mtime
+    except OSError:
+        return False
+    if time.time() - index_mtime > max_age:
+        return False
+    result = subprocess.run(
+        ['git', 'log', '-1', '--format=%ct'],
+        cwd=project_path, capture_output=True, text=True
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        return False
+    return index_mtime >= int(result.stdout)
 
 
 def git_rev_parse_head(project_path: str) -> str:
@@ -566,13 +777,55 @@ def ensure_feature_branch(plan_path: str, project_path: str) -> str:
 
 # --- Tooling detection ---
 
+# Files whose presence (and package.json's scripts) decide the detected tooling
+_TOOLING_MARKERS = ('pyproject.toml', 'uv.lock', 'setup.py', 'package.json', 'go.mod')
+
+
 def detect_tooling(project_path: str) -> tuple[str, str, str]:
     """Detect test command, lint command, and format command for the project.
 
+    Results are cached in memory and in impl-logs/tooling.json until one of
+    the marker files appears, disappears or is modified.
+
     Returns:
         Tuple of (test_cmd, lint_cmd, format_cmd)
     """
-    project = Path(project_path)
+    marker_sig = []
+    for marker in _TOOLING_MARKERS:
+        try:
+            st = os.stat(os.path.join(project_path, marker))
+            marker_sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            marker_sig.append(None)
+    return _detect_tooling_cached(project_path, tuple(marker_sig))
+
+
+@lru_cache(maxsize=8)
+def _detect_tooling_cached(project_path: str,
+                           marker_sig: tuple[tuple[int, int] | None, ...]) -> tuple[str, str, str]:
+    """Return tooling from the on-disk cache if marker_sig matches, else detect and store it."""
+    # Lives in impl-logs/ so the fix pass's `git add -A` never commits it
+    cache_file = Path(project_path) / 'memories' / 'shared' / 'impl-logs' / 'tooling.json'
+    markers = [list(sig) if sig else None for sig in marker_sig]
+    try:
+        cached = json_loads(cache_file.read_bytes())
+        if cached.get('markers') == markers:
+            test_cmd, lint_cmd, format_cmd = cached['tooling']
+            return test_cmd, lint_cmd, format_cmd
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    tooling = _scan_tooling(Path(project_path))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({'markers': markers, 'tooling': tooling}))
+    except OSError:
+        pass
+    return tooling
+
+
+def _scan_tooling(project: Path) -> tuple[str, str, str]:
+    """Detect tooling from the marker files in project."""
 
     # Python with uv
     if (project / 'pyproject.toml').exists() and (project / 'uv.lock').exists():
@@ -607,6 +860,26 @@ def detect_tooling(project_path: str) -> tuple[str, str, str]:
 
 # --- Plan section extraction ---
 
+_HEADING_MARK_RE = re.compile(r'^(#{1,2})(?=\s)', re.MULTILINE)
+_TITLE_RE = re.compile(r'#\s+(.+)$', re.MULTILINE)
+_TITLE_LINE_RE = re.compile(r'^#\s+.+\n*')
+_H2_RE = re.compile(r'^##\s+.+$', re.MULTILINE)
+# Headings containing any of these are context, not tasks, in the fallback split
+_SKIP_HEADING_RE = re.compile(
+    'context|overview|background|success criteria|verification'
+    '|critical reference|key design|implementation order'
+)
+_PHASE_RE = re.compile(
+    r'##\s+(?:Phase\s+\d+|Implementation\s+(?:Step\s+)?\d+|\d+\.\s+).+$', re.MULTILINE
+)
+_CHECKBOX_RE = re.compile(r'^[-*]\s+\[[ x]\]\s+.+$', re.MULTILINE)
+# **File**: `...` / **Path**: `...` markers, or inline backtick spans that look like paths
+_FILE_PATHS_RE = re.compile(
+    r'\*\*(?:File|Path)\*\*:\s*`([^`]+)`'
+    r'|`((?:[a-zA-Z0-9_./-]+/)[a-zA-Z0-9_.-]+\.[a-z]{1,4})`'
+)
+
+
 def extract_plan_sections(content: str) -> dict[str, str]:
     """Extract key sections from a plan file.
 
@@ -621,34 +894,56 @@ def extract_plan_sections(content: str) -> dict[str, str]:
         if end > 0:
             body = content[end + 3:].strip()
 
+    # Walk the # and ## heading markers once, matching each heading in place
+    title = None
+    h2_starts: list[int] = []
+    phase_starts: list[int] = []
+    phase_end = 0
+    for mark in _HEADING_MARK_RE.finditer(body):
+        start = mark.start()
+        if len(mark.group(1)) == 1:
+            if title is None:
+                title_match = _TITLE_RE.match(body, start)
+                if title_match:
+                    title = title_match.group(1).strip()
+            continue
+        h2_starts.append(start)
+        # ## Phase N, ## Implementation Step N or ## N. heading
+        if start >= phase_end:
+            phase_match = _PHASE_RE.match(body, start)
+            if phase_match:
+                phase_starts.append(start)
+                phase_end = phase_match.end()
+
     # Extract title (first # heading)
-    title_match = re.search(r'^#\s+(.+)$', body, re.MULTILINE)
-    sections['title'] = title_match.group(1).strip() if title_match else 'Implementation'
+    sections['title'] = title if title is not None else 'Implementation'
 
     # Extract overview/context — everything before first ## heading
-    first_h2 = re.search(r'^##\s+', body, re.MULTILINE)
-    if first_h2:
-        overview = body[:first_h2.start()].strip()
+    if h2_starts:
+        overview = body[:h2_starts[0]].strip()
         # Remove the title line itself
-        overview = re.sub(r'^#\s+.+\n*', '', overview).strip()
+        overview = _TITLE_LINE_RE.sub('', overview).strip()
         sections['overview'] = overview
     else:
         sections['overview'] = ''
 
-    # Extract phases (## Phase N or ## Implementation Step N or ## N. heading)
-    phase_pattern = r'^##\s+(?:Phase\s+\d+|Implementation\s+(?:Step\s+)?\d+|\d+\.\s+).+$'
-    phase_matches = list(re.finditer(phase_pattern, body, re.MULTILINE))
-    if phase_matches:
-        phases_text = []
-        for i, match in enumerate(phase_matches):
-            start = match.start()
-            end = phase_matches[i + 1].start() if i + 1 < len(phase_matches) else len(body)
-            phases_text.append(body[start:end].strip())
-        sections['phases'] = '\n\n'.join(phases_text)
+    # Extract phases, each running up to the next phase heading
+    if phase_starts:
+        phase_ends = phase_starts[1:] + [len(body)]
+        sections['phases'] = '\n\n'.join(
+            body[start:end].strip() for start, end in zip(phase_starts, phase_ends)
+        )
     else:
-        # Fallback: extract all ## sections as potential task sections
-        h2_pattern = r'^##\s+.+$'
-        h2_matches = list(re.finditer(h2_pattern, body, re.MULTILINE))
+        # Fallback: extract all ## sections as potential task sections,
+        # reusing the ## markers found above
+        h2_matches = []
+        h2_end = 0
+        for start in h2_starts:
+            if start >= h2_end:
+                h2_match = _H2_RE.match(body, start)
+                if h2_match:
+                    h2_matches.append(h2_match)
+                    h2_end = h2_match.end()
         if h2_matches:
             all_sections = []
             for i, match in enumerate(h2_matches):
@@ -656,11 +951,7 @@ def extract_plan_sections(content: str) -> dict[str, str]:
                 end = h2_matches[i + 1].start() if i + 1 < len(h2_matches) else len(body)
                 section_text = body[start:end].strip()
                 # Skip non-task sections
-                heading = match.group(0).lower()
-                if any(skip in heading for skip in ['context', 'overview', 'background',
-                                                     'success criteria', 'verification',
-                                                     'critical reference', 'key design',
-                                                     'implementation order']):
+                if _SKIP_HEADING_RE.search(match.group(0).lower()):
                     continue
                 all_sections.append(section_text)
             sections['phases'] = '\n\n'.join(all_sections) if all_sections else body
@@ -668,47 +959,91 @@ def extract_plan_sections(content: str) -> dict[str, str]:
             sections['phases'] = body
 
     # Extract success criteria (checkbox lines)
-    criteria_lines = re.findall(r'^[-*]\s+\[[ x]\]\s+.+$', body, re.MULTILINE)
+    criteria_lines = _CHECKBOX_RE.findall(body)
     sections['criteria'] = '\n'.join(criteria_lines) if criteria_lines else ''
 
-    # Extract file paths (bold file patterns)
-    file_paths = re.findall(r'\*\*(?:File|Path)\*\*:\s*`([^`]+)`', body)
-    # Also find backtick paths that look like file paths (must contain / or start with a word char)
-    file_paths += re.findall(r'`((?:[a-zA-Z0-9_./-]+/)[a-zA-Z0-9_.-]+\.[a-z]{1,4})`', body)
-    sections['files'] = '\n'.join(f'- `{p}`' for p in sorted(set(file_paths))) if file_paths else ''
+    # Extract file paths (bold file patterns and backtick paths) in one pass
+    file_paths = {bold or inline for bold, inline in _FILE_PATHS_RE.findall(body)}
+    sections['files'] = '\n'.join(f'- `{p}`' for p in sorted(file_paths)) if file_paths else ''
 
     return sections
 
 
 # --- Codebase index refresh ---
 
-def refresh_codebase_indexes(project_path: str) -> None:
+# codebase_overview_<dirname><suffix>, with one alternative per INDEXER_MAP suffix
+_INDEX_FILE_RE = re.compile(
+    r'^codebase_overview_(.*)(' + '|'.join(map(re.escape, INDEXER_MAP)) + r')$'
+)
+
+# Directories every indexer skips, so changes inside them never affect an index
+_STAMP_SKIP_DIRS = frozenset({
+    '.git', '.svn', '.hg', '.idea', '.vscode', '.claude',
+    '__pycache__', 'build', 'memories', 'node_modules',
+})
+
+
+def _source_signature(source_dir: str, indexer_script: Path) -> str:
+    """Hash the path, mtime and size of every file an indexer could read."""
+    digest = hashlib.sha1()
+    script_stat = indexer_script.stat()
+    digest.update(f'{indexer_script}:{script_stat.st_mtime_ns}:{script_stat.st_size}\n'.encode())
+    stack = [source_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _STAMP_SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        digest.update(f'{entry.path}:{st.st_mtime_ns}:{st.st_size}\n'.encode())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def find_index_files(project_path: str) -> list[Path]:
+    """List the codebase index files under memories/codebase."""
+    codebase_dir = Path(project_path) / 'memories' / 'codebase'
+    if not codebase_dir.exists():
+        return []
+    return list(codebase_dir.glob('codebase_overview_*.md'))
+
+
+def refresh_codebase_indexes(project_path: str, index_files: list[Path] | None = None,
+                             log_dir: Path | None = None) -> None:
     """Re-run indexers for all existing codebase index files.
 
     Parses index filenames to determine which indexer and source directory to use,
-    then re-runs each indexer directly (no Claude call).
+    then re-runs each indexer directly (no Claude call). An indexer is skipped when
+    the stat signature of its source tree matches the stamp from its last run.
+    Pass index_files to reuse a listing from find_index_files(), and log_dir to
+    reuse the caller's impl-logs/ path.
     """
-    codebase_dir = Path(project_path) / 'memories' / 'codebase'
-    if not codebase_dir.exists():
+    if index_files is None:
+        index_files = find_index_files(project_path)
+    if not index_files:
         return
 
-    helpers_dir = Path(project_path) / '.claude' / 'helpers'
-    index_files = list(codebase_dir.glob('codebase_overview_*.md'))
+    project = Path(project_path)
+    helpers_dir = project / '.claude' / 'helpers'
+    if log_dir is None:
+        log_dir = project / 'memories' / 'shared' / 'impl-logs'
+    # Stamps are transient, so keep them in impl-logs/ next to the other artifacts
+    stamp_dir = log_dir / 'index-stamps'
 
+    jobs: list[tuple[Path, str, Path]] = []
     for index_file in index_files:
-        filename = index_file.name  # e.g., codebase_overview_backend_py.md
-
-        # Find which indexer to use based on suffix
-        indexer_script = None
-        for suffix, script in INDEXER_MAP.items():
-            if filename.endswith(suffix):
-                indexer_script = helpers_dir / script
-                # Extract dirname: remove prefix 'codebase_overview_' and the suffix
-                prefix = 'codebase_overview_'
-                dirname = filename[len(prefix):-len(suffix)]
-                break
+        # e.g., codebase_overview_backend_py.md -> ('backend', '_py.md')
+        match = _INDEX_FILE_RE.match(index_file.name)
+        if not match:
+            continue
+        dirname, suffix = match.groups()
+        indexer_script = helpers_dir / INDEXER_MAP[suffix]
 
-        if not indexer_script or not indexer_script.exists():
+        if not indexer_script.exists():
             continue
 
         # Map dirname to source directory
@@ -718,13 +1053,27 @@ def refresh_codebase_indexes(project_path: str) -> None:
             source_dir = f'./{dirname}/'
 
         # Verify source directory exists
-        full_source = Path(project_path) / source_dir
+        full_source = project / source_dir
         if not full_source.exists():
             continue
 
-        # Re-run indexer
+        jobs.append((indexer_script, source_dir, index_file))
+
+    if not jobs:
+        return
+
+    def run_indexer(job: tuple[Path, str, Path]) -> None:
+        indexer_script, source_dir, index_file = job
+        stamp_file = stamp_dir / f'{index_file.stem}.stamp'
+        signature = _source_signature(os.path.join(project_path, source_dir), indexer_script)
+        try:
+            if stamp_file.read_text() == signature:
+                return
+        except OSError:
+            pass
+
         try:
-            subprocess.run(
+            result = subprocess.run(
                 [sys.executable, str(indexer_script), source_dir,
                  '-o', str(index_file)],
                 cwd=project_path,
@@ -733,15 +1082,29 @@ def refresh_codebase_indexes(project_path: str) -> None:
             )
         except (subprocess.TimeoutExpired, OSError) as e:
             stream_progress('Indexing', f'Warning: Failed to refresh {index_file.name}: {e}')
+            return
+
+        if result.returncode == 0:
+            stamp_dir.mkdir(parents=True, exist_ok=True)
+            stamp_file.write_text(signature)
+
+    # Indexers are independent subprocesses, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(len(jobs), len(INDEXER_MAP))) as executor:
+        list(executor.map(run_indexer, jobs))
 
 
 # --- Review / Fix loops ---
 
 def run_review(project_path: str, build_result: BuildResult,
-               config: ImplementConfig, review_cycle: int) -> str:
+               config: ImplementConfig, review_cycle: int,
+               index_files: list[Path] | None = None) -> tuple[str, str]:
     """Run a code review on changes since pre_impl_commit.
 
-    Returns 'REVIEW_PASS', 'REVIEW_NEEDS_FIXES', or 'REVIEW_UNKNOWN'.
+    index_files is passed through to refresh_codebase_indexes().
+
+    Returns (verdict, session_id): verdict is 'REVIEW_PASS', 'REVIEW_NEEDS_FIXES',
+    or 'REVIEW_UNKNOWN'; session_id is the review's Claude session ('' if unknown),
+    which run_fix() resumes so the reviewed context is served from the prompt cache.
     """
     stream_progress('Review', f'Review cycle {review_cycle}/{config.max_review_cycles}')
 
@@ -749,19 +1112,25 @@ def run_review(project_path: str, build_result: BuildResult,
     log_dir = Path(project_path) / 'memories' / 'shared' / 'impl-logs'
     log_dir.mkdir(parents=True, exist_ok=True)
     diff_file = log_dir / 'review-diff.patch'
-    with diff_file.open('w') as f:
-        subprocess.run(
-            ['git', 'diff', build_result.pre_commit, 'HEAD'],
+    # Count lines while streaming the diff to disk instead of reading it back.
+    # --no-color/--no-ext-diff keep user diff config from slowing or mangling the patch.
+    diff_lines = 0
+    with diff_file.open('wb') as f:
+        process = subprocess.Popen(
+            ['git', 'diff', '--no-color', '--no-ext-diff', build_result.pre_commit, 'HEAD'],
             cwd=project_path,
-            stdout=f,
+            stdout=subprocess.PIPE,
         )
+        while chunk := process.stdout.read1(65536):
+            f.write(chunk)
+            diff_lines += chunk.count(b'\n')
+        process.wait()
 
-    diff_lines = len(diff_file.read_text().splitlines())
     diff_rel = os.path.relpath(diff_file, project_path)
     stream_progress('Review', f'Diff: {diff_lines} lines saved to {diff_rel}')
 
     # Refresh indexes before review
-    refresh_codebase_indexes(project_path)
+    refresh_codebase_indexes(project_path, index_files, log_dir)
 
     # Build context file references
     context_files = []
@@ -772,8 +1141,10 @@ def run_review(project_path: str, build_result: BuildResult,
     context_files.append(f'- Diff: `{diff_rel}`')
     context_section = '\n'.join(context_files)
 
-    # REVIEW.md also goes in impl-logs/ to avoid accidental commits
+    # REVIEW.md also goes in impl-logs/ to avoid accidental commits. Drop the
+    # previous cycle's copy so its verdict can't be mistaken for this one's.
     review_md_path = log_dir / 'REVIEW.md'
+    review_md_path.unlink(missing_ok=True)
     review_md_rel = os.path.relpath(review_md_path, project_path)
 
     # Build review prompt — closely mirrors /code_reviewer command
@@ -858,40 +1229,57 @@ REVIEW_NEEDS_FIXES  (has critical issues or improvements that should be fixed)
 - Every issue MUST include file:line reference and specific fix suggestion.
 """
 
-    run_claude_command(
+    def verdict_written(line: bytes) -> bool:
+        # The verdict closes REVIEW.md, so once a tool call leaves one there the
+        # review is complete and the closing chat message can be skipped
+        return b'"tool_result"' in line and read_review_verdict(review_md_path) is not None
+
+    _, output, _ = run_claude_command(
         ['claude-safe', '--no-firewall', '--', '-p', review_prompt],
-        cwd=project_path, timeout=600, phase='Review'
+        cwd=project_path, timeout=600, phase='Review', stop_when=verdict_written
     )
+    session_match = _SESSION_ID_RE.search(output)
+    session_id = session_match.group(1) if session_match else ''
 
-    # Read verdict from REVIEW.md — check last 20 lines where verdict should be
     if not review_md_path.exists():
         stream_progress('Review', f'Warning: {review_md_rel} not created')
-        return 'REVIEW_UNKNOWN'
+        return 'REVIEW_UNKNOWN', session_id
 
-    review_content = review_md_path.read_text(encoding='utf-8')
-    tail = '\n'.join(review_content.splitlines()[-20:])
+    verdict = read_review_verdict(review_md_path)
+    if verdict:
+        stream_progress('Review', f'Verdict: {verdict}')
+        return verdict, session_id
+    stream_progress('Review', f'Warning: No clear verdict in {review_md_rel}')
+    return 'REVIEW_UNKNOWN', session_id
 
+
+def read_review_verdict(review_md_path: Path) -> str | None:
+    """Return the verdict from the last 20 lines of REVIEW.md, or None if absent."""
+    try:
+        review_content = review_md_path.read_text(encoding='utf-8')
+    except OSError:
+        return None
+    tail = '\n'.join(review_content.splitlines()[-20:])
     if 'REVIEW_NEEDS_FIXES' in tail:
-        stream_progress('Review', 'Verdict: REVIEW_NEEDS_FIXES')
         return 'REVIEW_NEEDS_FIXES'
-    elif 'REVIEW_PASS' in tail:
-        stream_progress('Review', 'Verdict: REVIEW_PASS')
+    if 'REVIEW_PASS' in tail:
         return 'REVIEW_PASS'
-    else:
-        stream_progress('Review', f'Warning: No clear verdict in {review_md_rel}')
-        return 'REVIEW_UNKNOWN'
+    return None
 
 
 def run_fix(project_path: str, config: ImplementConfig,
-            pre_commit: str) -> BuildResult:
+            pre_commit: str, review_session: str = '') -> BuildResult:
     """Run a single fix pass to address review findings.
 
     Creates a fix prompt from REVIEW.md and runs Claude once.
     pre_commit is the original baseline, preserved across review-fix cycles.
+    If review_session is given, the fix continues that review conversation
+    (--resume) instead of re-reading the plan, research and diff from scratch;
+    if resuming fails (no session in the output, or nothing committed), the
+    pass is retried once without it.
     """
-    review_md_rel = os.path.relpath(
-        Path(project_path) / 'memories' / 'shared' / 'impl-logs' / 'REVIEW.md', project_path
-    )
+    log_dir = Path(project_path) / 'memories' / 'shared' / 'impl-logs'
+    review_md_rel = os.path.relpath(log_dir / 'REVIEW.md', project_path)
 
     # Build reference documents section
     ref_docs = []
@@ -904,7 +1292,9 @@ def run_fix(project_path: str, config: ImplementConfig,
         step += 1
     ref_section = '\n'.join(ref_docs)
 
-    fix_prompt = f"""You are fixing issues identified in a code review.
+    resume_note = ('The review above is complete. You are now allowed to modify code.\n\n'
+                   if review_session else '')
+    fix_prompt = f"""{resume_note}You are fixing issues identified in a code review.
 
 ## Before You Start
 1. Read `{review_md_rel}` for the review findings.
@@ -929,37 +1319,48 @@ When all Critical Issues and Improvements are fixed, tests pass, and linter pass
 output exactly: IMPL_DONE
 """
 
-    stream_progress('Fix', 'Running fix pass...')
-
-    returncode, output, elapsed = run_claude_command(
-        ['claude-safe', '--no-firewall', '--', '-p', fix_prompt,
-         '--max-turns', str(config.max_turns)],
-        cwd=project_path,
-        timeout=900,
-        phase='Fix'
-    )
+    command = ['claude-safe', '--no-firewall', '--', '-p', fix_prompt,
+               '--max-turns', str(config.max_turns)]
+    head_before = ''
+    if review_session:
+        command += ['--resume', review_session]
+        head_before = git_rev_parse_head(project_path)
+        stream_progress('Fix', f'Running fix pass (resuming review session {review_session[:8]})...')
+    else:
+        stream_progress('Fix', 'Running fix pass...')
 
-    success = 'IMPL_DONE' in output
+    try:
+        returncode, output, elapsed = run_claude_command(
+            command,
+            cwd=project_path,
+            timeout=900,
+            phase='Fix',
+            log_path=log_dir / 'fix.log',
+        )
+    except CommandTimeout as e:
+        # Whatever it committed is still reviewed in the next cycle
+        stream_progress('Fix', f'Stopped: {e}')
+        return BuildResult(success=False, iterations=1, pre_commit=pre_commit)
+
+    # The sentinel comes with Claude's final message and result event at the very end
+    success = 'IMPL_DONE' in output[-SENTINEL_SCAN_CHARS:]
+    if review_session and returncode != 0 and not success and (
+            not _SESSION_ID_RE.search(output) or git_rev_parse_head(project_path) == head_before):
+        # The resume itself failed (session expired or lost): nothing ran or
+        # nothing was committed, so fix from scratch once. A pass that committed
+        # and then ran out of turns is left to the next review cycle instead.
+        stream_progress('Fix', f'Resume failed (exit={returncode}), retrying without --resume...')
+        return run_fix(project_path, config, pre_commit)
     stream_progress('Fix', f'Complete ({format_duration(elapsed)}, '
                     f'{"IMPL_DONE" if success else "no IMPL_DONE"})')
 
     return BuildResult(success=success, iterations=1, pre_commit=pre_commit)
 
 
-def save_review_with_frontmatter(project_path: str, review_cycle: int) -> str | None:
-    """Save REVIEW.md with proper frontmatter to memories/shared/reviews/.
-
-    Returns path to saved review, or None on failure.
-    """
-    review_file = Path(project_path) / 'memories' / 'shared' / 'impl-logs' / 'REVIEW.md'
-    if not review_file.exists():
-        return None
-
-    review_content = review_file.read_text(encoding='utf-8')
-
-    # Run spec_metadata.sh for frontmatter values
+def read_spec_metadata(project_path: str) -> dict[str, str]:
+    """Run spec_metadata.sh and parse its 'Key: value' lines (empty dict on failure)."""
     metadata_script = Path(project_path) / '.claude' / 'helpers' / 'spec_metadata.sh'
-    metadata = {}
+    metadata: dict[str, str] = {}
     if metadata_script.exists():
         try:
             result = subprocess.run(
@@ -968,12 +1369,33 @@ def save_review_with_frontmatter(project_path: str, review_cycle: int) -> str |
                 capture_output=True, text=True, timeout=30
             )
             if result.returncode == 0:
-                for line in result.stdout.strip().splitlines():
-                    if ':' in line:
-                        key, _, value = line.partition(':')
+                for line in result.stdout.splitlines():
+                    key, sep, value = line.partition(':')
+                    if sep:
                         metadata[key.strip()] = value.strip()
         except (subprocess.TimeoutExpired, OSError):
             pass
+    return metadata
+
+
+def save_review_with_frontmatter(project_path: str, review_cycle: int,
+                                 metadata: dict[str, str] | None = None) -> str | None:
+    """Save REVIEW.md with proper frontmatter to memories/shared/reviews/.
+
+    metadata is the output of read_spec_metadata(); it is fetched here if not given.
+
+    Returns path to saved review, or None on failure.
+    """
+    project = Path(project_path)
+    review_file = project / 'memories' / 'shared' / 'impl-logs' / 'REVIEW.md'
+    if not review_file.exists():
+        return None
+
+    review_content = review_file.read_text(encoding='utf-8')
+
+    # spec_metadata.sh values for the frontmatter
+    if metadata is None:
+        metadata = read_spec_metadata(project_path)
 
     # Build frontmatter
     date = metadata.get('Current Date/Time (TZ)', time.strftime('%Y-%m-%d %H:%M:%S %Z'))
@@ -1005,7 +1427,7 @@ last_updated_by: orchestrator
 """
 
     # Save to memories/shared/reviews/
-    reviews_dir = Path(project_path) / 'memories' / 'shared' / 'reviews'
+    reviews_dir = project / 'memories' / 'shared' / 'reviews'
     reviews_dir.mkdir(parents=True, exist_ok=True)
 
     output_path = reviews_dir / filename
@@ -1017,10 +1439,8 @@ last_updated_by: orchestrator
 def _cleanup_impl_artifacts(project_path: str) -> None:
     """Remove transient artifacts from impl-logs/ after archiving."""
     log_dir = Path(project_path) / 'memories' / 'shared' / 'impl-logs'
-    for name in ('review-diff.patch', 'REVIEW.md', 'fix-prompt.md'):
-        artifact = log_dir / name
-        if artifact.exists():
-            artifact.unlink()
+    for name in ('review-diff.patch', 'REVIEW.md', 'fix-prompt.md', 'implement.log', 'fix.log'):
+        (log_dir / name).unlink(missing_ok=True)
 
 
 # --- Research auto-discovery ---
@@ -1272,10 +1692,12 @@ Next step: Review the plan, then run --phase implement"""
 def _run_handoff_session(project_path: str, plan_path: str,
                          research_path: str, review_path: str,
                          pre_commit: str, current_commit: str,
-                         status: str) -> None:
+                         status: str, exec_handoff: bool = False) -> None:
     """Open an interactive Claude session with full implementation context.
 
     Shows what was done, what was fixed, and what's open for improvement.
+    With exec_handoff the session replaces this process via os.execvp, so the
+    orchestrator's memory is released and this function does not return.
     """
     # Build list of files to read
     read_instructions = []
@@ -1317,6 +1739,13 @@ The user can ask you to fix remaining issues, run tests, or make additional chan
 When ready for cleanup, suggest running: `cly-clean {plan_path}`
 """
 
+    if exec_handoff:
+        print_phase_header('Handoff')
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.chdir(project_path)
+        os.execvp('claude-safe', ['claude-safe', '--no-firewall', '--', handoff_prompt])
+
     run_claude_interactive_command(
         handoff_prompt,
         cwd=project_path,
@@ -1330,8 +1759,8 @@ def run_phase_implement(plan_path: str, project_path: str,
     """Phase 2: /implement_plan → review → fix → handoff.
 
     Steps:
-        1. Validate plan, detect tooling, auto-discover research
-        2. Index codebase, ensure feature branch
+        1. Validate plan, ensure feature branch
+        2. Index codebase while detecting tooling and auto-discovering research
         3. Run /implement_plan (single invocation, includes plan-validator)
         4. Review → fix cycles (max 3: automated review with verdict, fix if needed)
         5. Archive review, clean up transient artifacts
@@ -1352,14 +1781,39 @@ def run_phase_implement(plan_path: str, project_path: str,
 
     config.plan_path = plan_path
 
+    # Step 1: Index codebase. Tooling detection, research discovery and the
+    # pre-implement HEAD snapshot don't depend on the index, so they run in
+    # the background while indexing holds the foreground (and its signals).
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tooling_future = executor.submit(detect_tooling, project_path)
+        research_future = (executor.submit(auto_discover_research, plan_path, project_path)
+                           if not research_path else None)
+        pre_commit_future = executor.submit(git_rev_parse_head, project_path)
+
+        # An index written after the last commit (e.g. by the plan phase) is still current
+        index_path = find_codebase_index(project_path)
+        if codebase_index_is_fresh(index_path, project_path, config.index_max_age):
+            stream_progress('Indexing',
+                            f'Skipped: {os.path.relpath(index_path, project_path)} is newer than HEAD')
+        else:
+            stream_progress('Indexing', 'Running /index_codebase via Claude...')
+            returncode, output, elapsed = run_claude_command(
+                ['claude-safe', '--no-firewall', '--', '-p', '/index_codebase'],
+                cwd=project_path, timeout=600, phase='Indexing'
+            )
+            if returncode != 0:
+                stream_progress('Indexing', f'Warning: Indexing returned code {returncode}')
+            else:
+                stream_progress('Indexing', f'Complete ({format_duration(elapsed)})')
+
     # Detect tooling
-    test_cmd, lint_cmd, _ = detect_tooling(project_path)
+    test_cmd, lint_cmd, _ = tooling_future.result()
     config.test_cmd = test_cmd
     config.lint_cmd = lint_cmd
 
     # Find research file
-    if not research_path:
-        research_path = auto_discover_research(plan_path, project_path)
+    if research_future:
+        research_path = research_future.result()
     config.research_path = research_path
 
     if research_path:
@@ -1367,70 +1821,69 @@ def run_phase_implement(plan_path: str, project_path: str,
     else:
         stream_progress('Implement', 'No research file found (use --research to specify)')
 
-    # Step 1: Index codebase
-    stream_progress('Indexing', 'Running /index_codebase via Claude...')
-    returncode, output, elapsed = run_claude_command(
-        ['claude-safe', '--no-firewall', '--', '-p', '/index_codebase'],
-        cwd=project_path, timeout=600, phase='Indexing'
-    )
-    if returncode != 0:
-        stream_progress('Indexing', f'Warning: Indexing returned code {returncode}')
-    else:
-        stream_progress('Indexing', f'Complete ({format_duration(elapsed)})')
-
     # Update config with detected codebase index
     index_path = find_codebase_index(project_path)
     if index_path:
         config.codebase_index = os.path.relpath(index_path, project_path)
 
     # Step 2: Run /implement_plan (single invocation — includes plan-validator)
-    pre_commit = git_rev_parse_head(project_path)
+    pre_commit = pre_commit_future.result()
 
     # Build the /implement_plan prompt with additional context
-    implement_prompt = f'/implement_plan {plan_path}'
-    context_parts = []
+    prompt_parts = [f'/implement_plan {plan_path}', '', 'Additional context:']
     if research_path:
-        context_parts.append(f'- Research: read `{research_path}` for codebase analysis and context.')
+        prompt_parts.append(f'- Research: read `{research_path}` for codebase analysis and context.')
     if config.codebase_index:
-        context_parts.append(f'- Codebase index: read `{config.codebase_index}` for the project map.')
-    context_parts.append(f'- Test command: `{test_cmd}`')
-    context_parts.append(f'- Lint command: `{lint_cmd}`')
-    if context_parts:
-        implement_prompt += '\n\nAdditional context:\n' + '\n'.join(context_parts)
-
-    implement_prompt += """
-
+        prompt_parts.append(f'- Codebase index: read `{config.codebase_index}` for the project map.')
+    prompt_parts.append(f'- Test command: `{test_cmd}`')
+    prompt_parts.append(f'- Lint command: `{lint_cmd}`')
+    prompt_parts.append("""
 After completing each phase, commit your work:
 ```
 git add -A && git commit -m "<type>[optional scope]: <description>"
 ```
-Follow Conventional Commits: feat, fix, refactor, test, docs, etc."""
+Follow Conventional Commits: feat, fix, refactor, test, docs, etc.""")
+    implement_prompt = '\n'.join(prompt_parts)
 
     stream_progress('Implement', 'Running /implement_plan (includes plan-validator)...')
-    returncode, output, elapsed = run_claude_command(
-        ['claude-safe', '--no-firewall', '--', '-p', implement_prompt,
-         '--max-turns', str(config.max_turns)],
-        cwd=project_path,
-        timeout=1800,
-        phase='Implement'
-    )
-    stream_progress('Implement',
-                    f'/implement_plan complete ({format_duration(elapsed)}, exit={returncode})')
+    log_dir = Path(project_path) / 'memories' / 'shared' / 'impl-logs'
+    log_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        returncode, output, elapsed = run_claude_command(
+            ['claude-safe', '--no-firewall', '--', '-p', implement_prompt,
+             '--max-turns', str(config.max_turns)],
+            cwd=project_path,
+            timeout=1800,
+            phase='Implement',
+            log_path=log_dir / 'implement.log',
+        )
+        stream_progress('Implement',
+                        f'/implement_plan complete ({format_duration(elapsed)}, exit={returncode})')
+    except CommandTimeout as e:
+        # Review what was committed before the limit rather than abort the phase
+        returncode = 1
+        stream_progress('Implement', f'/implement_plan stopped: {e}')
 
     # Step 3: Review → fix cycle (max review_cycles iterations)
     build_result = BuildResult(success=(returncode == 0), iterations=1, pre_commit=pre_commit)
     review_path = ''
     final_status = 'NEEDS_REVIEW'
     final_review_cycle = 0
+    # Indexing already ran, so the set of index files is fixed for the cycles below
+    index_files = find_index_files(project_path)
 
     for cycle in range(1, config.max_review_cycles + 1):
         final_review_cycle = cycle
 
-        # Review
-        verdict = run_review(project_path, build_result, config, cycle)
+        # Review, with spec_metadata.sh running alongside for the archived frontmatter
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            metadata_future = executor.submit(read_spec_metadata, project_path)
+            verdict, review_session = run_review(project_path, build_result, config, cycle,
+                                                 index_files)
 
-        # Archive the review
-        saved_review = save_review_with_frontmatter(project_path, cycle)
+            # Archive the review
+            saved_review = save_review_with_frontmatter(project_path, cycle,
+                                                        metadata_future.result())
         if saved_review:
             review_path = saved_review
             stream_progress('Review', f'Saved review: {review_path}')
@@ -1438,7 +1891,6 @@ Follow Conventional Commits: feat, fix, refactor, test, docs, etc."""
         # Check verdict
         if verdict == 'REVIEW_PASS':
             final_status = 'PASS'
-            _cleanup_impl_artifacts(project_path)
             stream_progress('Implement', f'Review passed on cycle {cycle}')
             break
 
@@ -1450,7 +1902,7 @@ Follow Conventional Commits: feat, fix, refactor, test, docs, etc."""
 
         # Fix
         stream_progress('Fix', f'Fixing issues from review cycle {cycle}...')
-        fix_result = run_fix(project_path, config, pre_commit)
+        fix_result = run_fix(project_path, config, pre_commit, review_session)
 
         if fix_result.success:
             stream_progress('Fix', 'Fix complete')
@@ -1460,12 +1912,12 @@ Follow Conventional Commits: feat, fix, refactor, test, docs, etc."""
     # Clean up transient artifacts
     _cleanup_impl_artifacts(project_path)
 
-    # Count commits made
+    # Count commits made (rev-list --count prints one number, no subjects)
     result = subprocess.run(
-        ['git', 'log', f'{pre_commit}..HEAD', '--oneline'],
+        ['git', 'rev-list', '--count', f'{pre_commit}..HEAD'],
         cwd=project_path, capture_output=True, text=True
     )
-    commit_count = len(result.stdout.strip().splitlines()) if result.stdout.strip() else 0
+    commit_count = int(result.stdout) if result.returncode == 0 and result.stdout.strip() else 0
 
     # Print summary
     try:
@@ -1473,19 +1925,17 @@ Follow Conventional Commits: feat, fix, refactor, test, docs, etc."""
     except RuntimeError:
         current_commit = 'unknown'
 
-    print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}", file=sys.stderr, flush=True)
-    print(f"\n{Fore.GREEN}{Style.BRIGHT}  Implement Summary{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
-    print(f"  Status:           {final_status}", file=sys.stderr, flush=True)
-    print(f"  Review cycles:    {final_review_cycle}", file=sys.stderr, flush=True)
-    print(f"  Commits made:     {commit_count}", file=sys.stderr, flush=True)
-    print(f"  Pre-implement:    {pre_commit[:8]}", file=sys.stderr, flush=True)
-    print(f"  Current HEAD:     {current_commit[:8]}", file=sys.stderr, flush=True)
-    print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
+    # One write so the block can't interleave with other stderr output
+    sys.stderr.write(_IMPLEMENT_SUMMARY.format(
+        status=final_status, review_cycles=final_review_cycle, commits=commit_count,
+        pre_commit=pre_commit, current_commit=current_commit,
+    ))
+    sys.stderr.flush()
 
     # Step 4: Interactive handoff — open a session with full context
     _run_handoff_session(
         project_path, plan_path, research_path, review_path,
-        pre_commit, current_commit, final_status,
+        pre_commit, current_commit, final_status, config.exec_handoff,
     )
 
     return ImplementPhaseResult(
@@ -1743,8 +2193,83 @@ def print_result(result: PlanPhaseResult | ImplementPhaseResult | CleanupPhaseRe
 
 # --- Main entry point ---
 
+def _implement_config(args) -> ImplementConfig:
+    """Build the implement-phase config from CLI args."""
+    return ImplementConfig(
+        max_turns=args.max_turns,
+        max_fix_iterations=args.max_fix_iterations,
+        max_review_cycles=args.max_review_cycles,
+        index_max_age=args.index_max_age,
+    )
+
+
+def _do_plan(args, project_path: str) -> None:
+    result = run_phase_plan(args.query_or_path, project_path, skip_refinement=args.no_refine)
+    print_result(result, args.json)
+
+
+def _do_implement(args, project_path: str) -> None:
+    config = _implement_config(args)
+    config.exec_handoff = args.exec_handoff
+    result = run_phase_implement(
+        args.query_or_path, project_path,
+        research_path=args.research or '',
+        config=config,
+    )
+    print_result(result, args.json)
+
+
+def _do_cleanup(args, project_path: str) -> None:
+    result = run_phase_cleanup(
+        args.query_or_path,
+        args.research or '',
+        args.review or '',
+        project_path
+    )
+    print_result(result, args.json)
+
+
+def _do_all(args, project_path: str) -> None:
+    # Run all phases sequentially
+    # Non-interactive mode for full run - only commit step remains interactive
+    plan_result = run_phase_plan(args.query_or_path, project_path,
+                                 skip_refinement=args.no_refine,
+                                 non_interactive=True)
+    print_result(plan_result, args.json)
+
+    implement_result = run_phase_implement(
+        plan_result.plan_path, project_path,
+        research_path=plan_result.research_path,
+        config=_implement_config(args),
+    )
+    print_result(implement_result, args.json)
+
+    cleanup_result = run_phase_cleanup(
+        plan_result.plan_path,
+        plan_result.research_path,
+        implement_result.review_path,
+        project_path
+    )
+    print_result(cleanup_result, args.json)
+
+
+# --phase value -> handler(args, project_path)
+PHASE_HANDLERS = {
+    'plan': _do_plan,
+    'implement': _do_implement,
+    'cleanup': _do_cleanup,
+    'all': _do_all,
+}
+
+
 def main() -> int:
     """Main CLI entry point."""
+    # CLI-only imports and terminal setup stay out of module import, so
+    # helpers can be imported by other scripts without the extra cost
+    import argparse
+
+    init()
+
     parser = argparse.ArgumentParser(
         description='Multi-phase Claude Code orchestrator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1762,12 +2287,15 @@ Examples:
         """
     )
     parser.add_argument('query_or_path', help='Query (for plan) or plan path (for implement/cleanup)')
-    parser.add_argument('--phase', choices=['plan', 'implement', 'cleanup', 'all'],
+    parser.add_argument('--phase', choices=list(PHASE_HANDLERS),
                         default='all', help='Which phase to run (default: all)')
     parser.add_argument('--project', default='.', help='Project directory path')
     parser.add_argument('--research', help='Research file path (for implement and cleanup phases)')
     parser.add_argument('--review', help='Review file path (for cleanup phase)')
     parser.add_argument('--json', action='store_true', help='Output JSON format')
+    parser.add_argument('--exec-handoff', action='store_true', dest='exec_handoff',
+                        help='Implement phase only: replace the orchestrator process with the '
+                             'handoff session (no result output or total time afterwards)')
     parser.add_argument('--no-refine', action='store_true', dest='no_refine',
                         help='Skip interactive query refinement (use original query as-is)')
     parser.add_argument('--max-turns', type=int, default=40,
@@ -1776,15 +2304,26 @@ Examples:
                         help='Fix loop iteration limit (default: 5)')
     parser.add_argument('--max-review-cycles', type=int, default=3,
                         help='Review-fix cycle limit (default: 3)')
+    parser.add_argument('--index-max-age', type=int, default=3600,
+                        help='Reuse a codebase index newer than HEAD and at most this many '
+                             'seconds old instead of re-indexing (0 = always re-index, default: 3600)')
 
     args = parser.parse_args()
-
-    # Handle SIGTERM and SIGINT for graceful shutdown
+    # Resolve once: every helper joins or relpaths against the project, and an
+    # absolute path saves each os.path.relpath() call its own getcwd()
+    project_path = str(Path(args.project).resolve())
+
+    # Handle SIGTERM and SIGINT for graceful shutdown. Exiting from the handler
+    # interrupts input() and makes subprocess.run() kill its child on the way
+    # out; only a streaming run, whose child sits in its own process group,
+    # defers the exit until its loop has stopped that group.
     def handle_signal(signum, frame):
-        sig_name = 'SIGTERM' if signum == signal.SIGTERM else 'SIGINT'
-        exit_code = 143 if signum == signal.SIGTERM else 130
-        print(f"\n{sig_name} received, shutting down...", file=sys.stderr)
-        sys.exit(exit_code)
+        global _shutdown_request
+        if _shutdown_request is None:
+            _shutdown_request = (('SIGTERM', 143) if signum == signal.SIGTERM
+                                 else ('SIGINT', 130))
+        if not _defer_shutdown:
+            exit_if_shutdown_requested()
 
     signal.signal(signal.SIGTERM, handle_signal)
     signal.signal(signal.SIGINT, handle_signal)
@@ -1792,69 +2331,17 @@ Examples:
     try:
         total_start = time.time()
 
-        if args.phase == 'plan':
-            result = run_phase_plan(args.query_or_path, args.project, skip_refinement=args.no_refine)
-            print_result(result, args.json)
-
-        elif args.phase == 'implement':
-            config = ImplementConfig(
-                max_turns=args.max_turns,
-                max_fix_iterations=args.max_fix_iterations,
-                max_review_cycles=args.max_review_cycles,
-            )
-            result = run_phase_implement(
-                args.query_or_path, args.project,
-                research_path=args.research or '',
-                config=config,
-            )
-            print_result(result, args.json)
-
-        elif args.phase == 'cleanup':
-            result = run_phase_cleanup(
-                args.query_or_path,
-                args.research or '',
-                args.review or '',
-                args.project
-            )
-            print_result(result, args.json)
-
-        elif args.phase == 'all':
-            # Run all phases sequentially
-            # Non-interactive mode for full run - only commit step remains interactive
-            plan_result = run_phase_plan(args.query_or_path, args.project,
-                                         skip_refinement=args.no_refine,
-                                         non_interactive=True)
-            print_result(plan_result, args.json)
-
-            config = ImplementConfig(
-                max_turns=args.max_turns,
-                max_fix_iterations=args.max_fix_iterations,
-                max_review_cycles=args.max_review_cycles,
-            )
-            implement_result = run_phase_implement(
-                plan_result.plan_path, args.project,
-                research_path=plan_result.research_path,
-                config=config,
-            )
-            print_result(implement_result, args.json)
-
-            cleanup_result = run_phase_cleanup(
-                plan_result.plan_path,
-                plan_result.research_path,
-                implement_result.review_path,
-                args.project
-            )
-            print_result(cleanup_result, args.json)
+        PHASE_HANDLERS[args.phase](args, project_path)
 
+        exit_if_shutdown_requested()
         total_elapsed = time.time() - total_start
         print(f"\n{Fore.BLUE}Total time:{Style.RESET_ALL} {format_duration(total_elapsed)}", file=sys.stderr)
 
         return 0
 
-    except KeyboardInterrupt:
-        print("\nInterrupted", file=sys.stderr)
-        return 130
     except Exception as e:
+        # A request held during a streaming run that then failed still wins
+        exit_if_shutdown_requested()
         print(f"\n{Fore.RED}Error: {e}{Style.RESET_ALL}", file=sys.stderr)
         return 1
 
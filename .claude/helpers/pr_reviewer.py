@@ -3,6 +3,7 @@
 # requires-python = ">=3.10"
 # dependencies = [
 #     "colorama>=0.4.6",
+#     "orjson>=3.9",
 # ]
 # ///
 """
@@ -26,19 +27,43 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import io
 import json
+import os
 import re
+import shutil
 import signal
 import subprocess
 import sys
 import time
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-from colorama import Fore, Style, init
+try:
+    # orjson parses gh's raw bytes directly and is several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-# Initialize colorama
-init()
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that emits no escape codes."""
+
+    def __getattr__(self, name: str) -> str:
+        return ''
+
+
+# Only load colorama when output goes to a terminal and NO_COLOR is unset
+if sys.stderr.isatty() and not os.environ.get('NO_COLOR'):
+    from colorama import Fore, Style, init
+
+    # Initialize colorama
+    init()
+else:
+    Fore = Style = _NoColor()
 
 # Color mapping for stages
 STAGE_COLORS = {
@@ -52,6 +77,40 @@ STAGE_COLORS = {
     'Review': Fore.GREEN,
 }
 
+# Per-user cache for gh checks and fetched PR data
+CACHE_DIR = Path.home() / '.cache' / 'claude-pr-reviewer'
+
+# Stamp file recording the last successful gh CLI check
+GH_STAMP_PATH = CACHE_DIR / 'gh_ok.stamp'
+GH_STAMP_TTL = 86400  # 24 hours
+
+# Changed-file lists are immutable per head commit
+PR_FILES_CACHE_TTL = 86400  # 24 hours
+
+# ETag entries are revalidated on every use, so they can live longer
+ETAG_CACHE_TTL = 7 * 86400  # 7 days
+
+# Page size for GitHub REST list endpoints (API maximum)
+GH_PER_PAGE = 100
+
+# Upper bound on gh processes running at once when fetching pages in parallel
+GH_MAX_CONCURRENCY = 10
+_gh_semaphore = asyncio.Semaphore(GH_MAX_CONCURRENCY)
+
+# stream-json lines carry whole tool results; raise asyncio's 64 KiB line cap
+STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+# Page number of the rel="last" entry in a GitHub Link header
+LINK_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Conditional request support for single-page list responses
+ETAG_HEADER_RE = re.compile(r'^etag:\s*(.+)$', re.IGNORECASE | re.MULTILINE)
+HTTP_NOT_MODIFIED_RE = re.compile(r'^HTTP/\S+\s+304\b')
+
+# Limits for existing comments included in the review context
+MAX_CONTEXT_COMMENTS = 10
+MAX_COMMENT_CHARS = 500
+
 
 # --- Result dataclasses ---
 
@@ -69,6 +128,35 @@ class PRInfo:
     additions: int
     deletions: int
 
+    @cached_property
+    def header_markdown(self) -> str:
+        """Markdown for the immutable PR part of the review context.
+
+        Covers everything up to and including the changed file list, so
+        repeated renders don't redo the O(files) work.
+        """
+        buf = io.StringIO()
+        w = buf.write
+
+        w("## PR Information\n\n")
+        w(f"**PR Number**: #{self.number}\n")
+        w(f"**Title**: {self.title}\n")
+        w(f"**Author**: {self.author}\n")
+        w(f"**URL**: {self.url}\n")
+        w(f"**Branch**: {self.head_branch} → {self.base_branch}\n")
+        w(f"**Changes**: +{self.additions}/-{self.deletions} in {len(self.changed_files)} files\n\n")
+
+        if self.body:
+            w(f"### Description\n\n{self.body}\n\n")
+
+        w("### Changed Files\n\n")
+        if self.changed_files:
+            # One C-level join instead of a formatted string per file
+            w("- `" + "`\n- `".join(self.changed_files) + "`\n")
+        w("\n")
+
+        return buf.getvalue()
+
 
 @dataclass
 class PRComment:
@@ -90,6 +178,14 @@ class PRReviewResult:
 
 # --- Utility functions ---
 
+def disable_color() -> None:
+    """Turn off ANSI colors for the rest of the run (--no-color)."""
+    global Fore, Style
+    Fore = Style = _NoColor()
+    for stage in STAGE_COLORS:
+        STAGE_COLORS[stage] = ''
+
+
 def print_phase_header(phase_name: str) -> None:
     """Print a prominent phase header with separators."""
     color = STAGE_COLORS.get(phase_name, Fore.WHITE)
@@ -179,6 +275,82 @@ def format_stream_event(line: str) -> str | None:
     return None
 
 
+# --- Process management ---
+
+async def kill_process_group(process: asyncio.subprocess.Process, grace: float = 5.0) -> None:
+    """Terminate a process started with start_new_session=True and its children.
+
+    Sends SIGTERM to the whole process group, then SIGKILL if it has not
+    exited within the grace period.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), timeout=grace)
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def run_shell_command(command: str, cwd: str, timeout: int) -> tuple[int, str]:
+    """Run a shell command in its own process group and capture its output.
+
+    On timeout or cancellation the whole process tree is killed before the
+    exception is re-raised; a timeout surfaces as subprocess.TimeoutExpired.
+
+    Returns:
+        Tuple of (return_code, combined_stdout_stderr)
+    """
+    process = await asyncio.create_subprocess_shell(
+        command,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        await kill_process_group(process)
+        raise subprocess.TimeoutExpired(command, timeout)
+    except BaseException:
+        await kill_process_group(process)
+        raise
+    return process.returncode, (stdout + stderr).decode('utf-8', errors='replace')
+
+
+# --- Disk cache ---
+
+def _cache_path(key: str) -> Path:
+    hashed = hashlib.sha256(key.encode()).hexdigest()
+    return CACHE_DIR / f"{hashed}.json"
+
+
+def cache_get(key: str, ttl_seconds: int) -> object | None:
+    """Return cached data for key if present and younger than ttl_seconds."""
+    try:
+        data = json.loads(_cache_path(key).read_text(encoding='utf-8'))
+        if time.time() - data['ts'] < ttl_seconds:
+            return data['data']
+    except (json.JSONDecodeError, KeyError, OSError):
+        pass
+    return None
+
+
+def cache_put(key: str, data: object) -> None:
+    """Store data under key; cache write failures are ignored."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(key).write_text(json.dumps({'ts': time.time(), 'data': data}), encoding='utf-8')
+    except OSError:
+        pass
+
+
 # --- Git and gh CLI functions ---
 
 def check_git_status_clean(project_path: str) -> bool:
@@ -203,25 +375,43 @@ def get_current_branch(project_path: str) -> str | None:
     return result.stdout.strip() if result.returncode == 0 else None
 
 
-def check_gh_cli() -> tuple[bool, str]:
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> str | None:
+    """Cached shutil.which lookup."""
+    return shutil.which(name)
+
+
+def check_gh_cli(force: bool = False) -> tuple[bool, str]:
     """Verify gh CLI is installed and authenticated.
 
+    A successful check is remembered in a stamp file for 24 hours so warm
+    runs skip the gh subprocess. Pass force=True to always re-check.
+
     Returns:
         Tuple of (success, error_message)
     """
+    if not force:
+        try:
+            if time.time() - GH_STAMP_PATH.stat().st_mtime < GH_STAMP_TTL:
+                return True, ""
+        except OSError:
+            pass
+
     # Check if gh is installed
-    try:
-        subprocess.run(['gh', '--version'], capture_output=True, check=True)
-    except FileNotFoundError:
+    if not find_executable('gh'):
         return False, "gh CLI is not installed. Install it from https://cli.github.com/"
-    except subprocess.CalledProcessError:
-        return False, "gh CLI check failed"
 
     # Check if authenticated
     result = subprocess.run(['gh', 'auth', 'status'], capture_output=True, text=True)
     if result.returncode != 0:
         return False, "gh CLI is not authenticated. Run 'gh auth login' to authenticate."
 
+    try:
+        GH_STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+        GH_STAMP_PATH.touch()
+    except OSError:
+        pass
+
     return True, ""
 
 
@@ -251,84 +441,189 @@ def parse_pr_input(input_str: str) -> int:
     raise ValueError(f"Cannot parse PR reference: {input_str}")
 
 
-def fetch_pr_info(pr_number: int, project_path: str) -> PRInfo | None:
-    """Fetch PR details using gh CLI."""
-    result = subprocess.run(
-        ['gh', 'pr', 'view', str(pr_number), '--json',
-         'number,title,author,baseRefName,headRefName,url,body,files,additions,deletions'],
-        cwd=project_path,
-        capture_output=True,
-        text=True
+async def run_gh(args: list[str], cwd: str) -> tuple[int, bytes]:
+    """Run a gh CLI command without blocking the event loop.
+
+    Every gh process opens its own HTTPS connection, so there is no
+    connection pool to share; fewer gh invocations is the only way to save
+    handshakes, and _gh_semaphore bounds how many are open at once.
+
+    Returns:
+        Tuple of (return_code, raw_stdout)
+    """
+    async with _gh_semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'gh', *args,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            return 127, b''
+        stdout, _ = await process.communicate()
+    return process.returncode, stdout
+
+
+async def fetch_gh_page(endpoint: str, page: int, project_path: str) -> list[dict] | None:
+    """Fetch a single page of a GitHub REST list endpoint via gh api."""
+    returncode, stdout = await run_gh(
+        ['api', f'{endpoint}?per_page={GH_PER_PAGE}&page={page}'],
+        project_path
     )
+    if returncode != 0:
+        return None
+    try:
+        return json_loads(stdout)
+    except json.JSONDecodeError:
+        return None
 
-    if result.returncode != 0:
+
+async def fetch_gh_list(endpoint: str, project_path: str, limit: int | None = None) -> list[dict] | None:
+    """Fetch every item of a paginated GitHub REST list endpoint via gh api.
+
+    Requests 100 items per page (GitHub's maximum). The first page is fetched
+    with response headers; once its Link rel="last" reveals the page count,
+    the remaining pages are fetched concurrently instead of walking rel="next".
+    With a limit, only the first `limit` items are requested in one page.
+
+    Single-page results are cached with their ETag and revalidated with
+    If-None-Match; a 304 response returns the cached items without a body
+    and does not count against the rate limit.
+
+    Returns:
+        List of items, or None if any page failed
+    """
+    per_page = limit or GH_PER_PAGE
+    cache_key = f"etag:{Path(project_path).resolve()}:{endpoint}?per_page={per_page}"
+    cached = cache_get(cache_key, ETAG_CACHE_TTL)
+
+    args = ['api', '--include', f'{endpoint}?per_page={per_page}&page=1']
+    if isinstance(cached, dict):
+        args[1:1] = ['-H', f"If-None-Match: {cached['etag']}"]
+    returncode, stdout = await run_gh(args, project_path)
+
+    raw_headers, _, body = stdout.partition(b'\r\n\r\n')
+    if not body:
+        raw_headers, _, body = stdout.partition(b'\n\n')
+    headers = raw_headers.decode('utf-8', errors='replace')
+    if isinstance(cached, dict) and HTTP_NOT_MODIFIED_RE.match(headers):
+        return cached['items']
+    if returncode != 0:
         return None
 
     try:
-        data = json.loads(result.stdout)
-        return PRInfo(
-            number=data.get('number', pr_number),
-            title=data.get('title', ''),
-            author=data.get('author', {}).get('login', 'unknown'),
-            base_branch=data.get('baseRefName', 'main'),
-            head_branch=data.get('headRefName', ''),
-            url=data.get('url', ''),
-            body=data.get('body', ''),
-            changed_files=[f.get('path', '') for f in data.get('files', [])],
-            additions=data.get('additions', 0),
-            deletions=data.get('deletions', 0)
-        )
-    except (json.JSONDecodeError, KeyError):
+        items = json_loads(body)
+    except json.JSONDecodeError:
         return None
 
+    match = None if limit else LINK_LAST_PAGE_RE.search(headers)
+    if match:
+        pages = await asyncio.gather(*(
+            fetch_gh_page(endpoint, page, project_path)
+            for page in range(2, int(match.group(1)) + 1)
+        ))
+        for page_items in pages:
+            if page_items is None:
+                return None
+            items.extend(page_items)
+    else:
+        etag = ETAG_HEADER_RE.search(headers)
+        if etag:
+            cache_put(cache_key, {'etag': etag.group(1).strip(), 'items': items})
+
+    return items
+
+
+async def fetch_pr_info(pr_number: int, project_path: str) -> PRInfo | None:
+    """Fetch PR details using gh CLI.
+
+    `gh pr view --json files` returns at most the first 100 files. When that
+    covers the whole PR (len(files) == changedFiles) no further request is
+    made; larger PRs fall back to the paginated REST endpoint. Either way the
+    list is cached on disk keyed by PR URL and head commit, so re-reviewing
+    the same commit skips the file-list fetch entirely.
+    """
+    returncode, stdout = await run_gh(
+        ['pr', 'view', str(pr_number), '--json',
+         'number,title,author,baseRefName,headRefName,headRefOid,url,body,'
+         'additions,deletions,changedFiles,files'],
+        project_path
+    )
 
-def fetch_pr_comments(pr_number: int, project_path: str) -> list[PRComment]:
-    """Fetch PR comments using gh API."""
-    comments = []
+    if returncode != 0:
+        return None
 
-    # Get review comments (on specific lines)
-    result = subprocess.run(
-        ['gh', 'api', f'repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments'],
-        cwd=project_path,
-        capture_output=True,
-        text=True
+    try:
+        data = json_loads(stdout)
+    except json.JSONDecodeError:
+        return None
+
+    head_sha = data.get('headRefOid', '')
+    cache_key = f"pr_files:{data.get('url', pr_number)}:{head_sha}"
+    changed_files = cache_get(cache_key, PR_FILES_CACHE_TTL) if head_sha else None
+    if changed_files is None:
+        files = data.get('files') or []
+        if len(files) == data.get('changedFiles', -1):
+            changed_files = [f.get('path', '') for f in files]
+        else:
+            files = await fetch_gh_list(f'repos/{{owner}}/{{repo}}/pulls/{pr_number}/files', project_path)
+            changed_files = [f.get('filename', '') for f in files or []]
+        if files is not None and head_sha:
+            cache_put(cache_key, changed_files)
+
+    return PRInfo(
+        number=data.get('number', pr_number),
+        title=data.get('title', ''),
+        author=data.get('author', {}).get('login', 'unknown'),
+        base_branch=data.get('baseRefName', 'main'),
+        head_branch=data.get('headRefName', ''),
+        url=data.get('url', ''),
+        body=data.get('body', ''),
+        changed_files=changed_files,
+        additions=data.get('additions', 0),
+        deletions=data.get('deletions', 0)
     )
 
-    if result.returncode == 0:
-        try:
-            data = json.loads(result.stdout)
-            for comment in data:
-                comments.append(PRComment(
-                    author=comment.get('user', {}).get('login', 'unknown'),
-                    body=comment.get('body', ''),
-                    path=comment.get('path'),
-                    line=comment.get('line')
-                ))
-        except json.JSONDecodeError:
-            pass
 
-    # Get issue comments (general PR comments)
-    result = subprocess.run(
-        ['gh', 'api', f'repos/{{owner}}/{{repo}}/issues/{pr_number}/comments'],
-        cwd=project_path,
-        capture_output=True,
-        text=True
+async def fetch_pr_comments(pr_number: int, project_path: str) -> list[PRComment]:
+    """Fetch PR comments using gh API.
+
+    Review comments (on specific lines) and issue comments (general PR
+    comments) are fetched concurrently; a failure in either yields no
+    comments from that endpoint. Only the review context's first
+    MAX_CONTEXT_COMMENTS are used, so one more than that is requested and
+    returned, just enough to tell whether the PR has more.
+    """
+    review_data, issue_data = await asyncio.gather(
+        fetch_gh_list(f'repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments', project_path,
+                      limit=MAX_CONTEXT_COMMENTS + 1),
+        fetch_gh_list(f'repos/{{owner}}/{{repo}}/issues/{pr_number}/comments', project_path,
+                      limit=MAX_CONTEXT_COMMENTS + 1),
+        return_exceptions=True
     )
 
-    if result.returncode == 0:
-        try:
-            data = json.loads(result.stdout)
-            for comment in data:
-                comments.append(PRComment(
-                    author=comment.get('user', {}).get('login', 'unknown'),
-                    body=comment.get('body', ''),
-                    path=None,
-                    line=None
-                ))
-        except json.JSONDecodeError:
-            pass
+    comments = []
 
-    return comments
+    if isinstance(review_data, list):
+        for comment in review_data:
+            comments.append(PRComment(
+                author=comment.get('user', {}).get('login', 'unknown'),
+                body=comment.get('body', ''),
+                path=comment.get('path'),
+                line=comment.get('line')
+            ))
+
+    if isinstance(issue_data, list):
+        for comment in issue_data:
+            comments.append(PRComment(
+                author=comment.get('user', {}).get('login', 'unknown'),
+                body=comment.get('body', ''),
+                path=None,
+                line=None
+            ))
+
+    return comments[:MAX_CONTEXT_COMMENTS + 1]
 
 
 def checkout_pr_branch(pr_number: int, project_path: str) -> tuple[str | None, str | None]:
@@ -454,6 +749,14 @@ def parse_go_imports(file_path: Path) -> set[str]:
     return imports
 
 
+# File extension -> import parser
+IMPORT_PARSERS = {
+    '.py': parse_python_imports,
+    '.go': parse_go_imports,
+    **{ext: parse_js_ts_imports for ext in ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')},
+}
+
+
 def detect_packages_in_changed_files(changed_files: list[str], project_path: str) -> list[str]:
     """Detect which packages are used in the changed files."""
     # Load project dependencies
@@ -462,22 +765,15 @@ def detect_packages_in_changed_files(changed_files: list[str], project_path: str
         return []
 
     # Parse imports from each changed file
+    root = Path(project_path)
     all_imports: set[str] = set()
     for file_path in changed_files:
-        full_path = Path(project_path) / file_path
-        if not full_path.exists():
-            continue
-
-        ext = full_path.suffix.lower()
-        if ext == '.py':
-            imports = parse_python_imports(full_path)
-        elif ext in ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'):
-            imports = parse_js_ts_imports(full_path)
-        elif ext == '.go':
-            imports = parse_go_imports(full_path)
-        else:
+        parser = IMPORT_PARSERS.get(Path(file_path).suffix.lower())
+        if parser is None:
             continue
-        all_imports.update(imports)
+        full_path = root / file_path
+        if full_path.exists():
+            all_imports.update(parser(full_path))
 
     # Match imports to project packages
     matched_packages = []
@@ -538,7 +834,7 @@ def detect_install_command(project_path: str) -> tuple[str | None, str]:
     return None, 'No dependency configuration detected'
 
 
-def install_dependencies(project_path: str) -> tuple[bool, str, float]:
+async def install_dependencies(project_path: str) -> tuple[bool, str, float]:
     """Install dependencies for the project.
 
     Returns:
@@ -551,20 +847,11 @@ def install_dependencies(project_path: str) -> tuple[bool, str, float]:
 
     stream_progress('Install', f'Running {description}...')
 
-    start_time = time.time()
-    result = subprocess.run(
-        install_cmd,
-        shell=True,
-        cwd=project_path,
-        capture_output=True,
-        text=True,
-        timeout=600  # 10 minute timeout
-    )
-    elapsed = time.time() - start_time
-
-    output = result.stdout + result.stderr
+    start_time = time.perf_counter()
+    returncode, output = await run_shell_command(install_cmd, project_path, timeout=600)  # 10 minute timeout
+    elapsed = time.perf_counter() - start_time
 
-    if result.returncode != 0:
+    if returncode != 0:
         # Get last 20 lines for error context
         lines = output.strip().split('\n')
         summary = '\n'.join(lines[-20:]) if len(lines) > 20 else output
@@ -609,7 +896,7 @@ def detect_test_command(project_path: str) -> tuple[str | None, str]:
     return None, 'No test configuration detected'
 
 
-def run_tests(project_path: str) -> tuple[bool, str, float]:
+async def run_tests(project_path: str) -> tuple[bool, str, float]:
     """Run tests for the project.
 
     Returns:
@@ -622,31 +909,21 @@ def run_tests(project_path: str) -> tuple[bool, str, float]:
 
     stream_progress('Tests', f'Running {description}...')
 
-    start_time = time.time()
-    result = subprocess.run(
-        test_cmd,
-        shell=True,
-        cwd=project_path,
-        capture_output=True,
-        text=True,
-        timeout=600  # 10 minute timeout
-    )
-    elapsed = time.time() - start_time
-
-    # Combine stdout and stderr for output
-    output = result.stdout + result.stderr
+    start_time = time.perf_counter()
+    returncode, output = await run_shell_command(test_cmd, project_path, timeout=600)  # 10 minute timeout
+    elapsed = time.perf_counter() - start_time
 
     # Get summary (last few lines usually have test results)
     lines = output.strip().split('\n')
     summary_lines = lines[-10:] if len(lines) > 10 else lines
     summary = '\n'.join(summary_lines)
 
-    return result.returncode == 0, summary, elapsed
+    return returncode == 0, summary, elapsed
 
 
 # --- Claude command execution ---
 
-def run_claude_command(command: list[str], cwd: str, timeout: int = 600, phase: str = '') -> tuple[int, str, float]:
+async def run_claude_command(command: list[str], cwd: str, timeout: int = 600, phase: str = '') -> tuple[int, str, float]:
     """Run a Claude Code command with real-time output streaming.
 
     Returns:
@@ -660,37 +937,44 @@ def run_claude_command(command: list[str], cwd: str, timeout: int = 600, phase:
     if phase:
         print_phase_header(phase)
 
-    start_time = time.time()
-    process = subprocess.Popen(
-        command,
+    start_time = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *command,
         cwd=cwd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,
+        limit=STREAM_LINE_LIMIT
     )
 
     output_lines = []
+
+    async def stream_output() -> None:
+        async for raw in process.stdout:
+            line = raw.decode('utf-8', errors='replace')
+            output_lines.append(line)
+            formatted = format_stream_event(line)
+            if formatted:
+                print(formatted, file=sys.stderr, flush=True)
+        await process.wait()
+
     try:
-        if process.stdout:
-            for line in process.stdout:
-                output_lines.append(line)
-                formatted = format_stream_event(line)
-                if formatted:
-                    print(formatted, file=sys.stderr, flush=True)
-
-        process.wait(timeout=timeout)
-    except subprocess.TimeoutExpired:
-        process.kill()
-        elapsed = time.time() - start_time
+        await asyncio.wait_for(stream_output(), timeout=timeout)
+    except asyncio.TimeoutError:
+        await kill_process_group(process)
+        elapsed = time.perf_counter() - start_time
         raise RuntimeError(f"Command timed out after {format_duration(elapsed)}")
+    except BaseException:
+        # Child runs in its own session, so it won't see the terminal's SIGINT
+        await kill_process_group(process)
+        raise
 
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
     returncode = process.returncode if process.returncode is not None else 1
     return returncode, ''.join(output_lines), elapsed
 
 
-def run_claude_interactive(initial_message: str, cwd: str, phase: str = '') -> tuple[int, float]:
+async def run_claude_interactive(initial_message: str, cwd: str, phase: str = '') -> tuple[int, float]:
     """Run Claude interactively with an initial message.
 
     Returns:
@@ -699,20 +983,28 @@ def run_claude_interactive(initial_message: str, cwd: str, phase: str = '') -> t
     if phase:
         print_phase_header(phase)
 
-    start_time = time.time()
-    process = subprocess.run(
-        ['claude', '--dangerously-skip-permissions', initial_message],
+    start_time = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        'claude', '--dangerously-skip-permissions', initial_message,
         cwd=cwd,
     )
-    elapsed = time.time() - start_time
-    return process.returncode, elapsed
+    try:
+        returncode = await process.wait()
+    except asyncio.CancelledError:
+        process.terminate()
+        await process.wait()
+        raise
+    elapsed = time.perf_counter() - start_time
+    return returncode, elapsed
 
 
 # --- Main orchestration ---
 
-def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip_index: bool = False, skip_docs: bool = False) -> PRReviewResult:
+async def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip_index: bool = False, skip_docs: bool = False, force_check: bool = False) -> PRReviewResult:
     """Run the full PR review workflow."""
     original_branch: str | None = None
+    tests_task: asyncio.Task | None = None
+    prep_task: asyncio.Task | None = None
 
     try:
         # Phase 1: Validate
@@ -727,7 +1019,7 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
         stream_progress('Validate', 'Git status: clean')
 
         # Check gh CLI
-        gh_ok, gh_error = check_gh_cli()
+        gh_ok, gh_error = check_gh_cli(force=force_check)
         if not gh_ok:
             stream_progress('Validate', f'Error: {gh_error}')
             raise RuntimeError(gh_error)
@@ -744,7 +1036,11 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
         # Phase 2: Fetch PR
         print_phase_header('Fetch PR')
 
-        pr_info = fetch_pr_info(pr_number, project_path)
+        # PR details and comments are independent; fetch them concurrently
+        pr_info, comments = await asyncio.gather(
+            fetch_pr_info(pr_number, project_path),
+            fetch_pr_comments(pr_number, project_path)
+        )
         if not pr_info:
             stream_progress('Fetch PR', f'Error: PR #{pr_number} not found')
             raise RuntimeError(f"PR #{pr_number} not found. Check that the PR exists and you have access.")
@@ -752,9 +1048,10 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
         stream_progress('Fetch PR', f'Author: {pr_info.author}')
         stream_progress('Fetch PR', f'Branch: {pr_info.head_branch} → {pr_info.base_branch}')
         stream_progress('Fetch PR', f'Changed files: {len(pr_info.changed_files)} (+{pr_info.additions}/-{pr_info.deletions})')
-
-        comments = fetch_pr_comments(pr_number, project_path)
-        stream_progress('Fetch PR', f'Comments: {len(comments)}')
+        if len(comments) > MAX_CONTEXT_COMMENTS:
+            stream_progress('Fetch PR', f'Comments: {MAX_CONTEXT_COMMENTS}+')
+        else:
+            stream_progress('Fetch PR', f'Comments: {len(comments)}')
 
         # Phase 3: Checkout
         print_phase_header('Checkout')
@@ -770,7 +1067,7 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
             stream_progress('Install', 'Skipped (--skip-tests)')
         else:
             print_phase_header('Install')
-            install_success, install_output, install_elapsed = install_dependencies(project_path)
+            install_success, install_output, install_elapsed = await install_dependencies(project_path)
 
             if install_success:
                 stream_progress('Install', f'Complete ({format_duration(install_elapsed)})')
@@ -782,13 +1079,73 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
                 raise RuntimeError("Dependency installation failed - aborting review")
 
         # Phase 5: Run tests
-        test_results: str = ""
+        # Tests run in the background while indexing and docs (independent of
+        # the test outcome) proceed; a test failure cancels those right away.
         if skip_tests:
             stream_progress('Tests', 'Skipped (--skip-tests)')
-            test_results = "Tests were skipped (--skip-tests flag used)"
         else:
             print_phase_header('Tests')
-            test_success, test_output, test_elapsed = run_tests(project_path)
+            tests_task = asyncio.create_task(run_tests(project_path))
+            await asyncio.sleep(0)  # let the test run start before the next phase header
+
+        async def index_and_fetch_docs() -> list[str]:
+            """Index the codebase and fetch docs; return the packages fetched."""
+            packages: list[str] = []
+            # Phase 6: Index codebase
+            if skip_index:
+                stream_progress('Indexing', 'Skipped (--skip-index)')
+            else:
+                returncode, output, elapsed = await run_claude_command(
+                    ['claude', '--dangerously-skip-permissions', '-p', '/index_codebase'],
+                    cwd=project_path,
+                    timeout=600,
+                    phase='Indexing'
+                )
+                if returncode != 0:
+                    stream_progress('Indexing', f'Warning: Indexing failed (code {returncode}), continuing...')
+                else:
+                    stream_progress('Indexing', f'Complete ({format_duration(elapsed)})')
+
+            # Phase 7: Fetch technical docs
+            if skip_docs:
+                stream_progress('Docs', 'Skipped (--skip-docs)')
+            else:
+                print_phase_header('Docs')
+                packages = await asyncio.to_thread(detect_packages_in_changed_files, pr_info.changed_files, project_path)
+                if packages:
+                    stream_progress('Docs', f'Detected packages in changed files: {", ".join(packages)}')
+                    # Pass packages to fetch_technical_docs
+                    quoted_pkgs = [f"'{pkg}'" if ' ' in pkg else pkg for pkg in packages]
+                    docs_prompt = f"/fetch_technical_docs {' '.join(quoted_pkgs)}"
+                    returncode, output, elapsed = await run_claude_command(
+                        ['claude', '--dangerously-skip-permissions', '-p', docs_prompt],
+                        cwd=project_path,
+                        timeout=600
+                    )
+                    if returncode != 0:
+                        stream_progress('Docs', f'Warning: Docs fetch failed (code {returncode}), continuing...')
+                        packages = []
+                    else:
+                        stream_progress('Docs', f'Complete ({format_duration(elapsed)})')
+                else:
+                    stream_progress('Docs', 'No packages detected in changed files, skipping')
+            return packages
+
+        prep_task = asyncio.create_task(index_and_fetch_docs())
+        if tests_task is not None:
+            await asyncio.wait({tests_task, prep_task}, return_when=asyncio.FIRST_COMPLETED)
+            if tests_task.done() and not tests_task.result()[0]:
+                # The review is aborted below, so don't let indexing/docs run on
+                prep_task.cancel()
+                await asyncio.gather(prep_task, return_exceptions=True)
+        packages_fetched = [] if prep_task.cancelled() else await prep_task
+
+        # Collect test results
+        test_results: str = ""
+        if tests_task is None:
+            test_results = "Tests were skipped (--skip-tests flag used)"
+        else:
+            test_success, test_output, test_elapsed = await tests_task
 
             if test_success:
                 stream_progress('Tests', f'Passed ({format_duration(test_elapsed)})')
@@ -801,46 +1158,6 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
                 print(f"{Fore.YELLOW}Use --skip-tests to bypass (not recommended).{Style.RESET_ALL}", file=sys.stderr)
                 raise RuntimeError("Tests failed - aborting review")
 
-        # Phase 6: Index codebase
-        packages_fetched: list[str] = []
-        if skip_index:
-            stream_progress('Indexing', 'Skipped (--skip-index)')
-        else:
-            returncode, output, elapsed = run_claude_command(
-                ['claude', '--dangerously-skip-permissions', '-p', '/index_codebase'],
-                cwd=project_path,
-                timeout=600,
-                phase='Indexing'
-            )
-            if returncode != 0:
-                stream_progress('Indexing', f'Warning: Indexing failed (code {returncode}), continuing...')
-            else:
-                stream_progress('Indexing', f'Complete ({format_duration(elapsed)})')
-
-        # Phase 7: Fetch technical docs
-        if skip_docs:
-            stream_progress('Docs', 'Skipped (--skip-docs)')
-        else:
-            print_phase_header('Docs')
-            packages = detect_packages_in_changed_files(pr_info.changed_files, project_path)
-            if packages:
-                stream_progress('Docs', f'Detected packages in changed files: {", ".join(packages)}')
-                # Pass packages to fetch_technical_docs
-                quoted_pkgs = [f"'{pkg}'" if ' ' in pkg else pkg for pkg in packages]
-                docs_prompt = f"/fetch_technical_docs {' '.join(quoted_pkgs)}"
-                returncode, output, elapsed = run_claude_command(
-                    ['claude', '--dangerously-skip-permissions', '-p', docs_prompt],
-                    cwd=project_path,
-                    timeout=600
-                )
-                if returncode != 0:
-                    stream_progress('Docs', f'Warning: Docs fetch failed (code {returncode}), continuing...')
-                else:
-                    packages_fetched = packages
-                    stream_progress('Docs', f'Complete ({format_duration(elapsed)})')
-            else:
-                stream_progress('Docs', 'No packages detected in changed files, skipping')
-
         # Phase 8: Interactive review
         # Build context for the review
         context = build_review_context(pr_info, comments, test_results)
@@ -849,7 +1166,7 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
 
 {context}"""
 
-        returncode, elapsed = run_claude_interactive(
+        returncode, elapsed = await run_claude_interactive(
             review_prompt,
             cwd=project_path,
             phase='Review'
@@ -865,6 +1182,12 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
         )
 
     finally:
+        # Stop background work before switching branches under it
+        pending = [t for t in (tests_task, prep_task) if t is not None and not t.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
         # Always restore original branch
         if original_branch:
             print(f"\n{Fore.CYAN}Restoring original branch: {original_branch}{Style.RESET_ALL}", file=sys.stderr)
@@ -876,63 +1199,64 @@ def run_pr_review(pr_ref: str, project_path: str, skip_tests: bool = False, skip
 
 def build_review_context(pr_info: PRInfo, comments: list[PRComment], test_results: str) -> str:
     """Build context string for the review command."""
-    lines = [
-        "## PR Information",
-        "",
-        f"**PR Number**: #{pr_info.number}",
-        f"**Title**: {pr_info.title}",
-        f"**Author**: {pr_info.author}",
-        f"**URL**: {pr_info.url}",
-        f"**Branch**: {pr_info.head_branch} → {pr_info.base_branch}",
-        f"**Changes**: +{pr_info.additions}/-{pr_info.deletions} in {len(pr_info.changed_files)} files",
-        "",
-    ]
-
-    if pr_info.body:
-        lines.extend([
-            "### Description",
-            "",
-            pr_info.body,
-            "",
-        ])
-
-    lines.extend([
-        "### Changed Files",
-        "",
-    ])
-    for f in pr_info.changed_files:
-        lines.append(f"- `{f}`")
-    lines.append("")
-
-    lines.extend([
-        "### Test Results",
-        "",
-        test_results,
-        "",
-    ])
+    buf = io.StringIO()
+    w = buf.write
+
+    w(pr_info.header_markdown)
+    w(f"### Test Results\n\n{test_results}\n\n")
 
     if comments:
-        lines.extend([
-            "### Existing Comments",
-            "",
-        ])
-        for comment in comments[:10]:  # Limit to first 10 comments
+        w("### Existing Comments\n\n")
+        for comment in comments[:MAX_CONTEXT_COMMENTS]:
             if comment.path:
-                lines.append(f"**{comment.author}** on `{comment.path}:{comment.line}`:")
+                w(f"**{comment.author}** on `{comment.path}:{comment.line}`:\n")
             else:
-                lines.append(f"**{comment.author}**:")
+                w(f"**{comment.author}**:\n")
             # Truncate long comments
-            body = comment.body[:500] + '...' if len(comment.body) > 500 else comment.body
-            lines.append(f"> {body}")
-            lines.append("")
+            body = comment.body
+            if len(body) > MAX_COMMENT_CHARS:
+                body = body[:MAX_COMMENT_CHARS] + '...'
+            w(f"> {body}\n\n")
 
-    return '\n'.join(lines)
+    # Drop the trailing blank line after the last section
+    return buf.getvalue()[:-1]
 
 
 # --- Main entry point ---
 
-def main() -> int:
-    """Main CLI entry point."""
+async def run_with_signal_handlers(coro):
+    """Await coro, turning SIGTERM/SIGINT into cooperative cancellation.
+
+    The handlers are registered on the running loop, so a signal cancels the
+    review task and lets every pending subprocess and cleanup block (branch
+    restore, process-group kills) finish before exiting with 143/130.
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    received: list[signal.Signals] = []
+
+    def handle_signal(sig: signal.Signals) -> None:
+        if not received:
+            print(f"\n{sig.name} received, shutting down...", file=sys.stderr)
+            received.append(sig)
+            task.cancel()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, handle_signal, sig)
+    try:
+        return await coro
+    except asyncio.CancelledError:
+        if received:
+            raise SystemExit(143 if received[0] == signal.SIGTERM else 130)
+        raise
+    finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
+
+
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description='GitHub PR Review Orchestrator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -943,6 +1267,7 @@ Examples:
   %(prog)s --skip-tests 123                 # Skip running tests
   %(prog)s --skip-docs 123                  # Skip documentation fetch
   %(prog)s --skip-index 123                 # Skip codebase indexing
+  %(prog)s --force-check 123                # Re-verify gh CLI auth
         """
     )
     parser.add_argument('pr_ref', help='PR number or GitHub URL')
@@ -950,31 +1275,31 @@ Examples:
     parser.add_argument('--skip-tests', action='store_true', help='Skip running tests (not recommended)')
     parser.add_argument('--skip-docs', action='store_true', help='Skip fetching technical docs')
     parser.add_argument('--skip-index', action='store_true', help='Skip codebase indexing')
+    parser.add_argument('--force-check', action='store_true', help='Re-check gh CLI even if a recent check succeeded')
+    parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+    return parser
 
-    args = parser.parse_args()
 
-    # Handle signals for graceful shutdown
-    def handle_signal(signum, frame):
-        sig_name = 'SIGTERM' if signum == signal.SIGTERM else 'SIGINT'
-        exit_code = 143 if signum == signal.SIGTERM else 130
-        print(f"\n{sig_name} received, shutting down...", file=sys.stderr)
-        sys.exit(exit_code)
+def main() -> int:
+    """Main CLI entry point."""
+    args = build_parser().parse_args()
 
-    signal.signal(signal.SIGTERM, handle_signal)
-    signal.signal(signal.SIGINT, handle_signal)
+    if args.no_color:
+        disable_color()
 
     try:
-        total_start = time.time()
+        total_start = time.perf_counter()
 
-        result = run_pr_review(
+        result = asyncio.run(run_with_signal_handlers(run_pr_review(
             args.pr_ref,
             args.project,
             skip_tests=args.skip_tests,
             skip_index=args.skip_index,
-            skip_docs=args.skip_docs
-        )
+            skip_docs=args.skip_docs,
+            force_check=args.force_check
+        )))
 
-        total_elapsed = time.time() - total_start
+        total_elapsed = time.perf_counter() - total_start
 
         # Print summary
         print(f"\n{Fore.GREEN}{Style.BRIGHT}PR Review Complete:{Style.RESET_ALL}")
@@ -15,13 +15,11 @@ Flow per item:
     1. Parse todo.md → find next actionable item
     2. Enrich query (project.md + decisions.md context)
     3. orch --phase plan "enriched query"
-    4. Micro-reflect → append to scratchpad.md
-    5. orch --phase implement plan.md
-    6. Micro-reflect → append to scratchpad.md
-    7. orch --phase cleanup plan.md
-    8. Consolidate: scratchpad.md → decisions.md
-    9. Update todo.md / done.md
-   10. Checkpoint → show summary, ask to continue
+    4. orch --phase implement plan.md
+    5. orch --phase cleanup plan.md
+    6. Reflect + consolidate (one Claude call): artifacts → scratchpad.md → decisions.md
+    7. Update todo.md / done.md
+    8. Checkpoint → show summary, ask to continue
 
 Usage:
     uv run .claude/helpers/sprint_runner.py
@@ -47,10 +45,22 @@ import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
-from colorama import Fore, Style, init
 
-# Initialize colorama
-init()
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that emits no escape codes."""
+
+    def __getattr__(self, name: str) -> str:
+        return ''
+
+
+# Only load colorama when output goes to a terminal and NO_COLOR is unset
+if sys.stderr.isatty() and not os.environ.get('NO_COLOR'):
+    from colorama import Fore, Style, init
+
+    # Initialize colorama
+    init()
+else:
+    Fore = Style = _NoColor()
 
 # Color mapping for stages
 STAGE_COLORS = {
@@ -94,14 +104,30 @@ class SprintResult:
 
 # --- Utility functions ---
 
+_SEPARATOR = f"{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}"
+
+# "[Stage] " prefixes keyed by (stage, color), built on first use
+_progress_prefixes: dict[tuple[str, str], str] = {}
+
+# Status words that override the stage color; an error anywhere beats 'Complete'
+_STATUS_RE = re.compile(r'FAILED|Error|Complete')
+_ERROR_STATUS_RE = re.compile(r'FAILED|Error')
+
+
 def stream_progress(stage: str, message: str) -> None:
     """Print progress update to stderr for real-time feedback."""
-    color = STAGE_COLORS.get(stage, Fore.WHITE)
-    if 'FAILED' in message or 'Error' in message:
-        color = Fore.RED
-    elif 'Complete' in message:
+    status = _STATUS_RE.search(message)
+    if status is None:
+        color = STAGE_COLORS.get(stage, Fore.WHITE)
+    elif status.group() == 'Complete' and _ERROR_STATUS_RE.search(message, status.end()) is None:
         color = Fore.GREEN
-    print(f"{color}[{stage}]{Style.RESET_ALL} {message}", file=sys.stderr, flush=True)
+    else:
+        color = Fore.RED
+    prefix = _progress_prefixes.get((stage, color))
+    if prefix is None:
+        prefix = _progress_prefixes[(stage, color)] = f"{color}[{stage}]{Style.RESET_ALL} "
+    sys.stderr.write(prefix + message + '\n')
+    sys.stderr.flush()
 
 
 def format_duration(seconds: float) -> str:
@@ -116,13 +142,36 @@ def format_duration(seconds: float) -> str:
 def print_phase_header(phase_name: str) -> None:
     """Print a prominent phase header with separators."""
     color = STAGE_COLORS.get(phase_name, Fore.WHITE)
-    print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}", file=sys.stderr, flush=True)
-    print(f"\n{color}  {phase_name}{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
-    print(f"{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
+    sys.stderr.write(f"\n{_SEPARATOR}\n\n{color}  {phase_name}{Style.RESET_ALL}\n\n{_SEPARATOR}\n\n")
+    sys.stderr.flush()
 
 
 # --- Todo parsing ---
 
+_CHECKBOX_RE = re.compile(r'^[-*]\s+\[ \]\s+')
+_BLOCKED_RE = re.compile(r'\[BLOCKED\]\s*', re.IGNORECASE)
+# Dependency annotations: (requires: X, Y) or (depends on: X)
+_DEP_RE = re.compile(r'\((?:requires|depends on|depends|needs):\s*([^)]+)\)', re.IGNORECASE)
+_DEP_STRIP_RE = re.compile(r'\s*\((?:requires|depends on|depends|needs):[^)]+\)', re.IGNORECASE)
+
+# Heading substrings mapped to priority levels / categories, first match wins.
+# Plural forms ('must haves', 'bugs', 'technical debt', ...) contain these keys.
+_PRIORITY_HEADINGS = (
+    ('must have', 'must_have'),
+    ('should have', 'should_have'),
+    ('could have', 'could_have'),
+)
+_CATEGORY_HEADINGS = (
+    ('feature', 'features'),
+    ('bug', 'bugs'),
+    ('fix', 'bugs'),
+    ('improvement', 'improvements'),
+    ('technical', 'technical'),
+    ('tech debt', 'technical'),
+    ('infrastructure', 'technical'),
+)
+
+
 def parse_todo(path: Path) -> list[TodoItem]:
     """Parse todo.md into list of TodoItem dataclasses.
 
@@ -133,76 +182,54 @@ def parse_todo(path: Path) -> list[TodoItem]:
     """
     if not path.exists():
         return []
+    return _parse_todo_lines(path.read_text(encoding='utf-8').splitlines())
 
-    content = path.read_text(encoding='utf-8')
-    lines = content.splitlines()
 
+def _parse_todo_lines(lines: list[str]) -> list[TodoItem]:
+    """Parse the lines of todo.md (see parse_todo())."""
     items: list[TodoItem] = []
     current_priority = 'should_have'
     current_category = 'features'
 
-    # Map section headings to priority levels
-    priority_map = {
-        'must have': 'must_have',
-        'must haves': 'must_have',
-        'should have': 'should_have',
-        'should haves': 'should_have',
-        'could have': 'could_have',
-        'could haves': 'could_have',
-    }
-
-    # Map category headings
-    category_map = {
-        'feature': 'features',
-        'features': 'features',
-        'bug': 'bugs',
-        'bugs': 'bugs',
-        'fix': 'bugs',
-        'fixes': 'bugs',
-        'improvement': 'improvements',
-        'improvements': 'improvements',
-        'technical': 'technical',
-        'tech debt': 'technical',
-        'technical debt': 'technical',
-        'infrastructure': 'technical',
-    }
-
     for line_num, line in enumerate(lines, start=1):
         stripped = line.strip()
 
+        # Most lines are blank or prose: only headings and list items matter
+        if not stripped or stripped[0] not in '#-*':
+            continue
+
         # Detect priority sections (## headings)
         if stripped.startswith('## '):
             heading = stripped[3:].strip().lower()
-            for key, val in priority_map.items():
-                if key in heading:
-                    current_priority = val
-                    break
+            current_priority = next(
+                (val for key, val in _PRIORITY_HEADINGS if key in heading), current_priority
+            )
 
         # Detect category sub-sections (### headings)
         elif stripped.startswith('### '):
             heading = stripped[4:].strip().lower()
-            for key, val in category_map.items():
-                if key in heading:
-                    current_category = val
-                    break
+            current_category = next(
+                (val for key, val in _CATEGORY_HEADINGS if key in heading), current_category
+            )
 
         # Detect unchecked todo items (- [ ] text)
-        elif re.match(r'^[-*]\s+\[ \]\s+', stripped):
+        elif stripped[0] != '#' and (checkbox := _CHECKBOX_RE.match(stripped)):
             # Extract the item text
-            text = re.sub(r'^[-*]\s+\[ \]\s+', '', stripped)
+            text = stripped[checkbox.end():]
 
             # Check for [BLOCKED] prefix
             is_blocked = '[BLOCKED]' in text.upper()
-            text = re.sub(r'\[BLOCKED\]\s*', '', text, flags=re.IGNORECASE).strip()
+            if is_blocked:
+                text = _BLOCKED_RE.sub('', text).strip()
 
             # Extract dependencies: (requires: X, Y) or (depends on: X)
             dependencies: list[str] = []
-            dep_match = re.search(r'\((?:requires|depends on|depends|needs):\s*([^)]+)\)', text, re.IGNORECASE)
+            dep_match = _DEP_RE.search(text)
             if dep_match:
                 dep_text = dep_match.group(1)
                 dependencies = [d.strip() for d in dep_text.split(',') if d.strip()]
                 # Remove the dependency annotation from text
-                text = re.sub(r'\s*\((?:requires|depends on|depends|needs):[^)]+\)', '', text, flags=re.IGNORECASE).strip()
+                text = _DEP_STRIP_RE.sub('', text).strip()
 
             items.append(TodoItem(
                 text=text,
@@ -216,57 +243,94 @@ def parse_todo(path: Path) -> list[TodoItem]:
     return items
 
 
+# Parsed items and raw lines per todo.md path, reused while (st_mtime_ns, st_size) is unchanged
+_todo_cache: dict[Path, tuple[tuple[int, int], list[TodoItem], list[str]]] = {}
+
+
+def _cached_parse_todo(path: Path) -> list[TodoItem]:
+    """parse_todo() that skips the re-read when the file hasn't changed since the last call."""
+    try:
+        st = path.stat()
+    except OSError:
+        _todo_cache.pop(path, None)
+        return []
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _todo_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    lines = path.read_text(encoding='utf-8').splitlines()
+    items = _parse_todo_lines(lines)
+    _todo_cache[path] = (stamp, items, lines)
+    return items
+
+
+def _read_todo_lines(path: Path) -> list[str]:
+    """Lines of todo.md, copied from the parse cache while the file is unchanged."""
+    cached = _todo_cache.get(path)
+    if cached:
+        st = path.stat()
+        if cached[0] == (st.st_mtime_ns, st.st_size):
+            return list(cached[2])
+    return path.read_text(encoding='utf-8').splitlines()
+
+
+# Sort rank of each priority (must_have first)
+_PRIORITY_ORDER = {'must_have': 0, 'should_have': 1, 'could_have': 2}
+
+# Completed item in done.md (matched against lowercased content)
+_DONE_ITEM_RE = re.compile(r'[-*]\s+\[x\]\s+(.+)')
+
+
+def _load_done_blob(done_path: Path) -> str:
+    """Lowercased descriptions of the completed items in done.md, one per line."""
+    if not done_path.exists():
+        return ''
+    done_content = done_path.read_text(encoding='utf-8').lower()
+    return '\n'.join(match.group(1).strip() for match in _DONE_ITEM_RE.finditer(done_content))
+
+
 def find_next_actionable(items: list[TodoItem], done_path: Path) -> TodoItem | None:
     """Filter out checked/blocked items, check dependencies against done.md.
 
     Returns highest-priority topmost item.
     """
-    # Load done items for dependency checking
-    done_items: set[str] = set()
-    if done_path.exists():
-        done_content = done_path.read_text(encoding='utf-8').lower()
-        # Extract completed item descriptions
-        for match in re.finditer(r'[-*]\s+\[x\]\s+(.+)', done_content):
-            done_items.add(match.group(1).strip().lower())
-
-    # Priority order
-    priority_order = {'must_have': 0, 'should_have': 1, 'could_have': 2}
-
-    # Filter actionable items
-    actionable = []
+    # Done items for dependency checking, one per line in a single string:
+    # a dependency is met if it occurs in any completed item's description.
+    # Only read (and regex-scanned) once an item with dependencies is reached.
+    done_blob: str | None = None
+
+    # Pick the highest-priority, topmost item in one pass. Blocked and
+    # dependency checks only run for items that would beat the current best.
+    best: TodoItem | None = None
+    best_key = (0, 0)
     for item in items:
+        key = (_PRIORITY_ORDER.get(item.priority, 9), item.line_number)
+        if best is not None and key >= best_key:
+            continue
         if item.is_blocked:
             continue
 
         # Check if dependencies are met
-        deps_met = True
-        for dep in item.dependencies:
-            dep_lower = dep.lower()
-            # Check if any done item contains this dependency text
-            if not any(dep_lower in done for done in done_items):
-                deps_met = False
-                break
+        if item.dependencies:
+            if done_blob is None:
+                done_blob = _load_done_blob(done_path)
+            if not all(dep.lower() in done_blob for dep in item.dependencies):
+                continue
 
-        if not deps_met:
-            continue
+        best, best_key = item, key
 
-        actionable.append(item)
+    return best
 
-    if not actionable:
-        return None
 
-    # Sort by priority (must_have first), then by line number (topmost first)
-    actionable.sort(key=lambda i: (priority_order.get(i.priority, 9), i.line_number))
-    return actionable[0]
+# --- Query enrichment ---
 
+_ENRICH_TIMEOUT = 120  # seconds
 
-# --- Query enrichment ---
 
-def enrich_query(item: TodoItem, project_path: str) -> str:
-    """Read project.md + decisions.md and formulate an enriched query.
+def _enrichment_prompt(item: TodoItem, project_path: str) -> str | None:
+    """Build the enrichment prompt from project.md + decisions.md.
 
-    Uses Claude (via subprocess) to create a 4-8 sentence enriched query
-    from the todo item + project context.
+    Returns None when neither file exists, i.e. there is nothing to enrich with.
     """
     project_dir = Path(project_path)
     project_md = project_dir / 'memories' / 'shared' / 'project' / 'project.md'
@@ -275,20 +339,22 @@ def enrich_query(item: TodoItem, project_path: str) -> str:
     # Build context from available files
     context_parts = []
 
+    # Text-mode read(n) returns at most n characters, so only the prefix that
+    # goes into the prompt is read and decoded, however large the files grow
     if project_md.exists():
-        content = project_md.read_text(encoding='utf-8')
-        # Take first 4000 chars for context
-        context_parts.append(f"## Project Context (from project.md):\n{content[:4000]}")
+        with project_md.open(encoding='utf-8') as f:
+            # Take first 4000 chars for context
+            content = f.read(4000)
+        context_parts.append(f"## Project Context (from project.md):\n{content}")
 
     if decisions_md.exists():
-        content = decisions_md.read_text(encoding='utf-8')
-        # decisions.md is the primary feedback loop — include generously
-        context_parts.append(f"## Project Decisions (from decisions.md):\n{content[:12000]}")
+        with decisions_md.open(encoding='utf-8') as f:
+            # decisions.md is the primary feedback loop — include generously
+            content = f.read(12000)
+        context_parts.append(f"## Project Decisions (from decisions.md):\n{content}")
 
     if not context_parts:
-        # No context files — return the raw item text
-        stream_progress('Enrich', 'No project context files found, using raw query')
-        return item.text
+        return None
 
     context = '\n\n'.join(context_parts)
 
@@ -310,28 +376,95 @@ Write a 4-8 sentence enriched query that includes:
 4. Dependency information if applicable
 
 Output ONLY the enriched query text, nothing else. No markdown formatting, no headers."""
+    return prompt
+
+
+def _start_enrichment(prompt: str, project_path: str) -> subprocess.Popen:
+    """Start the Claude call for an enrichment prompt without waiting for it."""
+    return subprocess.Popen(
+        ['claude', '-p', prompt, '--max-turns', '1', '--output-format', 'text'],
+        cwd=project_path,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        start_new_session=True,  # own process group, so stop_process_group() gets it all
+    )
+
+
+def stop_process_group(proc: subprocess.Popen) -> None:
+    """Terminate a start_new_session child and its process group, then reap it."""
+    if proc.poll() is None:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except (OSError, ProcessLookupError):
+            proc.kill()
+    proc.communicate()
+
 
+def prefetch_enrichment(item: TodoItem, project_path: str) -> subprocess.Popen | None:
+    """Start enriching item in the background; finish with collect_enrichment().
+
+    Returns None if there is no project context or Claude can't be started;
+    enrich_query() then handles the item (and reports why) when it comes up.
+    """
+    prompt = _enrichment_prompt(item, project_path)
+    if prompt is None:
+        return None
     try:
-        result = subprocess.run(
-            ['claude', '-p', prompt, '--max-turns', '1', '--output-format', 'text'],
-            cwd=project_path, capture_output=True, text=True, timeout=120,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            enriched = result.stdout.strip()
-            stream_progress('Enrich', f'Enriched query: {enriched[:100]}...')
-            return enriched
-    except (subprocess.TimeoutExpired, OSError) as e:
-        stream_progress('Enrich', f'Warning: Enrichment failed ({e}), using raw query')
+        return _start_enrichment(prompt, project_path)
+    except OSError:
+        return None
+
 
+def collect_enrichment(item: TodoItem, proc: subprocess.Popen, quiet: bool = False) -> str:
+    """Wait for an enrichment started by _start_enrichment() and return the query.
+
+    Falls back to the raw item text if the call fails or times out.
+    quiet suppresses progress output.
+    """
+    try:
+        stdout, _ = proc.communicate(timeout=_ENRICH_TIMEOUT)
+    except subprocess.TimeoutExpired as e:
+        stop_process_group(proc)
+        if not quiet:
+            stream_progress('Enrich', f'Warning: Enrichment failed ({e}), using raw query')
+        return item.text
+
+    if proc.returncode == 0 and stdout.strip():
+        enriched = stdout.strip()
+        if not quiet:
+            stream_progress('Enrich', f'Enriched query: {enriched[:100]}...')
+        return enriched
     return item.text
 
 
+def enrich_query(item: TodoItem, project_path: str) -> str:
+    """Read project.md + decisions.md and formulate an enriched query.
+
+    Uses Claude (via subprocess) to create a 4-8 sentence enriched query
+    from the todo item + project context.
+    """
+    prompt = _enrichment_prompt(item, project_path)
+    if prompt is None:
+        # No context files — return the raw item text
+        stream_progress('Enrich', 'No project context files found, using raw query')
+        return item.text
+
+    try:
+        proc = _start_enrichment(prompt, project_path)
+    except OSError as e:
+        stream_progress('Enrich', f'Warning: Enrichment failed ({e}), using raw query')
+        return item.text
+    return collect_enrichment(item, proc)
+
+
 # --- Orchestrator invocation ---
 
 def run_phase(phase: str, args: list[str], project_path: str,
               max_turns: int = 40, max_review_cycles: int = 3) -> tuple[int, str, float]:
     """Invoke orchestrator.py --phase <plan|implement|cleanup> --json.
 
+    The orchestrator's progress output (stderr) goes straight to our stderr
+    as it happens; only its stdout, the small --json result, is captured.
+
     Returns (returncode, stdout, elapsed_seconds).
     """
     helpers_dir = Path(project_path) / '.claude' / 'helpers'
@@ -356,11 +489,11 @@ def run_phase(phase: str, args: list[str], project_path: str,
     timeout_seconds = 2400  # 40 minutes max per phase
     proc = subprocess.Popen(
         cmd, cwd=project_path,
-        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        stdout=subprocess.PIPE, text=True,
         start_new_session=True,  # create new process group for clean cleanup
     )
     try:
-        stdout, stderr = proc.communicate(timeout=timeout_seconds)
+        stdout, _ = proc.communicate(timeout=timeout_seconds)
         elapsed = time.time() - start_time
         stream_progress(phase.capitalize(),
                         f'Complete ({format_duration(elapsed)}, exit={proc.returncode})')
@@ -379,8 +512,33 @@ def run_phase(phase: str, args: list[str], project_path: str,
         return 1, '', elapsed
 
 
+def warm_orchestrator_env(project_path: str) -> subprocess.Popen | None:
+    """Start resolving orchestrator.py's inline script dependencies in the background.
+
+    `uv run` would otherwise do this on the first plan phase. The caller
+    stops the sync with stop_process_group() if it's still running when the
+    sprint ends. Failures are ignored: `uv run` still resolves on its own.
+    """
+    orchestrator = Path(project_path) / '.claude' / 'helpers' / 'orchestrator.py'
+    try:
+        return subprocess.Popen(
+            ['uv', 'sync', '--script', str(orchestrator)],
+            cwd=project_path,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        return None
+
+
 # --- Micro-reflection ---
 
+def _stderr_note(stderr: str) -> str:
+    """Format the start of a failed command's stderr for a warning line."""
+    stderr = stderr.strip()
+    return f': {stderr[:500]}' if stderr else ''
+
+
 def micro_reflect(phase: str, plan_path: str, project_path: str,
                   research_path: str = '', review_path: str = '') -> bool:
     """Lightweight Claude call that appends raw observations to scratchpad.md.
@@ -402,20 +560,60 @@ def micro_reflect(phase: str, plan_path: str, project_path: str,
             ['claude', '-p', f'/reflect {reflect_args}',
              '--max-turns', '5', '--output-format', 'text'],
             cwd=project_path,
-            capture_output=True, text=True,
+            # Only the exit code matters; keep stderr for the warning
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
             timeout=180,
         )
         if result.returncode == 0:
             stream_progress('Reflect', 'Observations appended to scratchpad.md')
             return True
         else:
-            stream_progress('Reflect', f'Warning: Reflection returned code {result.returncode}')
+            stream_progress('Reflect', f'Warning: Reflection returned code {result.returncode}'
+                            f'{_stderr_note(result.stderr)}')
             return False
     except (subprocess.TimeoutExpired, OSError) as e:
         stream_progress('Reflect', f'Warning: Reflection failed ({e})')
         return False
 
 
+# --- Batched reflection + consolidation ---
+
+def reflect_and_consolidate(plan_path: str, project_path: str,
+                            research_path: str = '', review_path: str = '') -> bool:
+    """Single Claude call that runs /reflect on the item's artifacts, then /consolidate_memory.
+
+    Replaces the per-phase micro_reflect() calls and consolidate_memory() with
+    one session. Returns True on success.
+    """
+    stream_progress('Reflect', 'Reflecting and consolidating into decisions.md...')
+
+    reflect_args = plan_path
+    if research_path:
+        reflect_args += f' {research_path}'
+    if review_path:
+        reflect_args += f' {review_path}'
+
+    try:
+        result = subprocess.run(
+            ['claude', '-p', f'/reflect_and_consolidate {reflect_args}',
+             '--max-turns', '15', '--output-format', 'text'],
+            cwd=project_path,
+            # Only the exit code matters; keep stderr for the warning
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+            timeout=420,
+        )
+        if result.returncode == 0:
+            stream_progress('Reflect', 'Observations integrated into decisions.md')
+            return True
+        else:
+            stream_progress('Reflect', f'Warning: Reflect+consolidate returned code {result.returncode}'
+                            f'{_stderr_note(result.stderr)}')
+            return False
+    except (subprocess.TimeoutExpired, OSError) as e:
+        stream_progress('Reflect', f'Warning: Reflect+consolidate failed ({e})')
+        return False
+
+
 # --- Consolidation ---
 
 def consolidate_memory(project_path: str) -> bool:
@@ -436,14 +634,16 @@ def consolidate_memory(project_path: str) -> bool:
             ['claude', '-p', '/consolidate_memory',
              '--max-turns', '10', '--output-format', 'text'],
             cwd=project_path,
-            capture_output=True, text=True,
+            # Only the exit code matters; keep stderr for the warning
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
             timeout=300,
         )
         if result.returncode == 0:
             stream_progress('Consolidate', 'Successfully integrated into decisions.md')
             return True
         else:
-            stream_progress('Consolidate', f'Warning: Consolidation returned code {result.returncode}')
+            stream_progress('Consolidate', f'Warning: Consolidation returned code {result.returncode}'
+                            f'{_stderr_note(result.stderr)}')
             return False
     except (subprocess.TimeoutExpired, OSError) as e:
         stream_progress('Consolidate', f'Warning: Consolidation failed ({e})')
@@ -452,6 +652,28 @@ def consolidate_memory(project_path: str) -> bool:
 
 # --- Todo/Done updates ---
 
+def _check_off_in_place(todo_path: Path, item: TodoItem) -> bool:
+    """Overwrite the '[ ]' on item's line with '[x]' without rewriting todo.md.
+
+    Returns False (file untouched) if the line no longer holds the item.
+    """
+    with todo_path.open('r+b') as f:
+        data = f.read()
+        start = 0
+        for _ in range(item.line_number - 1):
+            start = data.find(b'\n', start) + 1
+            if start == 0:
+                return False
+        end = data.find(b'\n', start)
+        line = data[start:end if end != -1 else len(data)]
+        box = line.find(b'[ ]')
+        if box == -1 or item.text[:30].encode('utf-8') not in line:
+            return False
+        f.seek(start + box)
+        f.write(b'[x]')
+    return True
+
+
 def update_todo_done(item: TodoItem, plan_path: str, project_path: str,
                      new_tasks: list[str] | None = None) -> None:
     """Check off completed item in todo.md, add to done.md with traceability."""
@@ -459,10 +681,13 @@ def update_todo_done(item: TodoItem, plan_path: str, project_path: str,
     todo_path = project_dir / 'memories' / 'shared' / 'project' / 'todo.md'
     done_path = project_dir / 'memories' / 'shared' / 'project' / 'done.md'
 
-    # Update todo.md — check off the item
-    if todo_path.exists():
-        content = todo_path.read_text(encoding='utf-8')
-        lines = content.splitlines()
+    # Update todo.md — check off the item. If that's the only change and the
+    # item is still on its line, flip the checkbox bytes in place.
+    if todo_path.exists() and not new_tasks and _check_off_in_place(todo_path, item):
+        _todo_cache.pop(todo_path, None)
+        stream_progress('Todo', f'Checked off: {item.text[:60]}')
+    elif todo_path.exists():
+        lines = _read_todo_lines(todo_path)
 
         if 1 <= item.line_number <= len(lines):
             line = lines[item.line_number - 1]
@@ -490,6 +715,7 @@ def update_todo_done(item: TodoItem, plan_path: str, project_path: str,
                 lines.append(f'- [ ] {task}')
 
         todo_path.write_text('\n'.join(lines), encoding='utf-8')
+        _todo_cache.pop(todo_path, None)
         stream_progress('Todo', f'Checked off: {item.text[:60]}')
 
     # Update done.md — add the completed item
@@ -499,39 +725,49 @@ def update_todo_done(item: TodoItem, plan_path: str, project_path: str,
         done_path.parent.mkdir(parents=True, exist_ok=True)
         content = '# Done\n\n'
 
-    date_str = time.strftime('%Y-%m-%d')
-    month_section = time.strftime('## %Y-%m (%B %Y)')
+    # One clock read for both, so an item finished at midnight on the last day
+    # of a month can't get a date from one month filed under the other
+    now = time.localtime()
+    date_str = time.strftime('%Y-%m-%d', now)
+    month_section = time.strftime('## %Y-%m (%B %Y)', now)
 
     # Build the entry
     entry = f'- [x] {item.text} ({date_str})\n'
     if plan_path:
         entry += f'  - Plan: `{plan_path}`\n'
 
-    # Check if month section exists
+    # Work out where the entry goes (insert_at) and the text to insert there
+    category_header = f'### {item.category.replace("_", " ").title()}'
     month_pos = content.find(month_section)
     if month_pos == -1:
-        content += f'\n{month_section}\n'
-        month_pos = content.find(month_section)
-
-    # Determine the scope of this month section (up to the next ## heading)
-    next_month = content.find('\n## ', month_pos + len(month_section))
-    search_range_end = next_month if next_month != -1 else len(content)
-
-    # Add the completed item under the category header within the month section
-    category_header = f'### {item.category.replace("_", " ").title()}'
-    category_pos = content.find(category_header, month_pos, search_range_end)
-    if category_pos == -1:
-        # Create category within this month section
-        insert_at = search_range_end
-        content = content[:insert_at] + f'\n{category_header}\n{entry}' + content[insert_at:]
+        # New month section (with the category) at the end of the file
+        insert_at = len(content)
+        insertion = f'\n{month_section}\n\n{category_header}\n{entry}'
+    else:
+        # Determine the scope of this month section (up to the next ## heading)
+        next_month = content.find('\n## ', month_pos + len(month_section))
+        search_range_end = next_month if next_month != -1 else len(content)
+
+        # Add the completed item under the category header within the month section
+        category_pos = content.find(category_header, month_pos, search_range_end)
+        if category_pos == -1:
+            # Create category within this month section
+            insert_at = search_range_end
+            insertion = f'\n{category_header}\n{entry}'
+        else:
+            # Insert entry right after the category header
+            insert_at = category_pos + len(category_header)
+            # Skip past the newline after the header
+            if insert_at < len(content) and content[insert_at] == '\n':
+                insert_at += 1
+            insertion = entry
+
+    if insert_at == len(content) and done_path.exists():
+        # Appending (e.g. the first item of a month): don't rewrite the whole file
+        with done_path.open('a', encoding='utf-8') as f:
+            f.write(insertion)
     else:
-        # Insert entry right after the category header
-        insert_at = category_pos + len(category_header)
-        # Skip past the newline after the header
-        if insert_at < len(content) and content[insert_at] == '\n':
-            insert_at += 1
-        content = content[:insert_at] + entry + content[insert_at:]
-    done_path.write_text(content, encoding='utf-8')
+        done_path.write_text(content[:insert_at] + insertion + content[insert_at:], encoding='utf-8')
     stream_progress('Todo', f'Added to done.md: {item.text[:60]}')
 
 
@@ -589,6 +825,24 @@ def extract_orch_result(output: str) -> dict:
         return {}
 
 
+def _newest_plan(plans_dir: Path) -> Path | None:
+    """Most recently modified *.md in plans_dir, or None (single scandir pass)."""
+    newest: Path | None = None
+    newest_mtime = -1.0
+    try:
+        with os.scandir(plans_dir) as entries:
+            for entry in entries:
+                # Same selection as glob('*.md'): hidden files are skipped
+                if entry.name.startswith('.') or not entry.name.endswith('.md'):
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > newest_mtime:
+                    newest, newest_mtime = Path(entry.path), mtime
+    except OSError:
+        return None
+    return newest
+
+
 # --- Main sprint loop ---
 
 def run_sprint(
@@ -613,160 +867,187 @@ def run_sprint(
     consecutive_failures = 0
     item_count = 0
     seen_line_numbers: set[int] = set()  # Track seen items for dry-run mode
+    # (item text, enrichment process) started for the next item while the checkpoint waits
+    prefetched: tuple[str, subprocess.Popen] | None = None
+    warmup: subprocess.Popen | None = None
 
-    while True:
-        # Check max items
-        if max_items > 0 and item_count >= max_items:
-            stream_progress('Sprint', f'Reached max items ({max_items}), stopping')
-            break
-
-        # Re-parse todo.md each iteration (it may have been updated)
-        items = parse_todo(todo_path)
-        if not items:
-            stream_progress('Sprint', 'No items found in todo.md')
-            break
-
-        next_item = find_next_actionable(items, done_path)
-        if next_item is None:
-            stream_progress('Sprint', 'No actionable items remaining')
-            break
-
-        item_count += 1
-        print_phase_header(f'Sprint Item #{item_count}')
-        stream_progress('Sprint', f'Next: {next_item.text}')
-        stream_progress('Sprint', f'Priority: {next_item.priority}, Category: {next_item.category}')
-
-        if dry_run:
-            # Prevent infinite loop: in dry-run mode items are never checked off,
-            # so find_next_actionable() would return the same item forever.
-            if next_item.line_number in seen_line_numbers:
+    try:
+        while True:
+            # Check max items
+            if max_items > 0 and item_count >= max_items:
+                stream_progress('Sprint', f'Reached max items ({max_items}), stopping')
                 break
-            seen_line_numbers.add(next_item.line_number)
-
-            # Dry run: preview what would run without any API calls
-            print(f"\n{Fore.CYAN}Dry run — would execute:{Style.RESET_ALL}", file=sys.stderr, flush=True)
-            print(f"  Item: {next_item.text}", file=sys.stderr, flush=True)
-            print(f"  Priority: {next_item.priority}", file=sys.stderr, flush=True)
-            print(f"  Category: {next_item.category}", file=sys.stderr, flush=True)
-            print(f"  Query would be enriched with project.md + decisions.md context", file=sys.stderr, flush=True)
-            results.append(SprintResult(todo_item=next_item, completed=True))
-            continue
-
-        # --- Execute the sprint item ---
-        result = SprintResult(todo_item=next_item)
-
-        try:
-            # Step 1: Enrich query
-            enriched_query = enrich_query(next_item, project_path)
-
-            # Step 2: Plan phase
-            returncode, output, elapsed = run_phase(
-                'plan', [enriched_query],
-                project_path, max_turns=max_turns, max_review_cycles=max_review_cycles,
-            )
-
-            if returncode != 0:
-                result.error = f'Plan phase failed (exit={returncode})'
-                raise RuntimeError(result.error)
-
-            orch_result = extract_orch_result(output)
-            plan_path = orch_result.get('plan_path', '')
-            research_path = orch_result.get('research_path', '')
-
-            if not plan_path:
-                # Try to find the most recent plan file
-                plans_dir = project_dir / 'memories' / 'shared' / 'plans'
-                if plans_dir.exists():
-                    plan_files = sorted(plans_dir.glob('*.md'),
-                                        key=lambda f: f.stat().st_mtime, reverse=True)
-                    if plan_files:
-                        plan_path = str(plan_files[0].relative_to(project_dir))
-
-            if not plan_path:
-                result.error = 'Could not find plan file after plan phase'
-                raise RuntimeError(result.error)
-
-            result.plan_path = plan_path
-            stream_progress('Sprint', f'Plan created: {plan_path}')
-
-            # Step 3: Micro-reflect after plan (skip if --skip-reflection)
-            if not skip_reflection:
-                micro_reflect('plan', plan_path, project_path, research_path=research_path)
-
-            # Step 4: Implement phase
-            impl_args = [plan_path]
-            if research_path:
-                impl_args = ['--research', research_path] + impl_args
-
-            returncode, output, elapsed = run_phase(
-                'implement', impl_args,
-                project_path, max_turns=max_turns, max_review_cycles=max_review_cycles,
-            )
-
-            if returncode != 0:
-                result.error = f'Implement phase failed (exit={returncode})'
-                raise RuntimeError(result.error)
-
-            impl_result = extract_orch_result(output)
-            review_path = impl_result.get('review_path', '')
-            result.review_path = review_path
-
-            # Step 5: Micro-reflect after implement (skip if --skip-reflection)
-            if not skip_reflection:
-                micro_reflect('implement', plan_path, project_path,
-                              research_path=research_path, review_path=review_path)
-
-            # Step 6: Cleanup phase
-            cleanup_args = [plan_path]
-            if research_path:
-                cleanup_args = ['--research', research_path] + cleanup_args
-            if review_path:
-                cleanup_args = ['--review', review_path] + cleanup_args
-
-            returncode, output, elapsed = run_phase(
-                'cleanup', cleanup_args,
-                project_path, max_turns=max_turns, max_review_cycles=max_review_cycles,
-            )
-
-            cleanup_succeeded = (returncode == 0)
-            if not cleanup_succeeded:
-                stream_progress('Cleanup', f'Warning: Cleanup phase failed (exit={returncode})')
-                # Don't fail the whole sprint item for cleanup issues
-
-            # Step 7: Consolidate (skip if --skip-reflection)
-            if not skip_reflection:
-                consolidate_memory(project_path)
 
-            # Step 8: Update todo.md / done.md (only if cleanup didn't handle it)
-            if not cleanup_succeeded:
-                update_todo_done(next_item, plan_path, project_path)
-
-            result.completed = True
-            consecutive_failures = 0
+            # Re-parse todo.md only if it changed (cleanup may have checked items off)
+            items = _cached_parse_todo(todo_path)
+            if not items:
+                stream_progress('Sprint', 'No items found in todo.md')
+                break
 
-        except RuntimeError as e:
-            result.error = str(e)
-            result.completed = False
-            consecutive_failures += 1
-            stream_progress('Error', f'Item failed: {e}')
+            next_item = find_next_actionable(items, done_path)
+            if next_item is None:
+                stream_progress('Sprint', 'No actionable items remaining')
+                break
 
-        except Exception as e:
-            result.error = f'Unexpected error: {e}'
-            result.completed = False
-            consecutive_failures += 1
-            stream_progress('Error', f'Unexpected: {e}')
+            if not dry_run and item_count == 0:
+                # Sync the orchestrator's script environment while the first item is enriched
+                warmup = warm_orchestrator_env(project_path)
 
-        results.append(result)
+            item_count += 1
+            print_phase_header(f'Sprint Item #{item_count}')
+            stream_progress('Sprint', f'Next: {next_item.text}')
+            stream_progress('Sprint', f'Priority: {next_item.priority}, Category: {next_item.category}')
 
-        # Check for 3 consecutive failures
-        if consecutive_failures >= 3:
-            stream_progress('Sprint', 'Stopping: 3 consecutive failures')
-            break
+            if dry_run:
+                # Prevent infinite loop: in dry-run mode items are never checked off,
+                # so find_next_actionable() would return the same item forever.
+                if next_item.line_number in seen_line_numbers:
+                    break
+                seen_line_numbers.add(next_item.line_number)
+
+                # Dry run: preview what would run without any API calls
+                print(f"\n{Fore.CYAN}Dry run — would execute:{Style.RESET_ALL}", file=sys.stderr, flush=True)
+                print(f"  Item: {next_item.text}", file=sys.stderr, flush=True)
+                print(f"  Priority: {next_item.priority}", file=sys.stderr, flush=True)
+                print(f"  Category: {next_item.category}", file=sys.stderr, flush=True)
+                print(f"  Query would be enriched with project.md + decisions.md context", file=sys.stderr, flush=True)
+                results.append(SprintResult(todo_item=next_item, completed=True))
+                continue
+
+            # --- Execute the sprint item ---
+            result = SprintResult(todo_item=next_item)
+
+            try:
+                # Step 1: Enrich query (reusing the prefetch if it was for this item)
+                if prefetched and prefetched[0] == next_item.text:
+                    enriched_query = collect_enrichment(next_item, prefetched[1], quiet=True)
+                    stream_progress('Enrich', f'Enriched query (prefetched): {enriched_query[:100]}...')
+                else:
+                    if prefetched:
+                        stop_process_group(prefetched[1])
+                    enriched_query = enrich_query(next_item, project_path)
+                prefetched = None
+
+                # Step 2: Plan phase
+                returncode, output, elapsed = run_phase(
+                    'plan', [enriched_query],
+                    project_path, max_turns=max_turns, max_review_cycles=max_review_cycles,
+                )
+
+                if returncode != 0:
+                    result.error = f'Plan phase failed (exit={returncode})'
+                    raise RuntimeError(result.error)
+
+                orch_result = extract_orch_result(output)
+                plan_path = orch_result.get('plan_path', '')
+                research_path = orch_result.get('research_path', '')
+
+                if not plan_path:
+                    # Try to find the most recent plan file
+                    newest_plan = _newest_plan(project_dir / 'memories' / 'shared' / 'plans')
+                    if newest_plan:
+                        plan_path = str(newest_plan.relative_to(project_dir))
+
+                if not plan_path:
+                    result.error = 'Could not find plan file after plan phase'
+                    raise RuntimeError(result.error)
+
+                result.plan_path = plan_path
+                stream_progress('Sprint', f'Plan created: {plan_path}')
+
+                # Step 3: Implement phase
+                impl_args = [plan_path]
+                if research_path:
+                    impl_args = ['--research', research_path] + impl_args
+
+                returncode, output, elapsed = run_phase(
+                    'implement', impl_args,
+                    project_path, max_turns=max_turns, max_review_cycles=max_review_cycles,
+                )
+
+                if returncode != 0:
+                    result.error = f'Implement phase failed (exit={returncode})'
+                    raise RuntimeError(result.error)
+
+                impl_result = extract_orch_result(output)
+                review_path = impl_result.get('review_path', '')
+                result.review_path = review_path
+
+                # Step 4: Cleanup phase
+                cleanup_args = [plan_path]
+                if research_path:
+                    cleanup_args = ['--research', research_path] + cleanup_args
+                if review_path:
+                    cleanup_args = ['--review', review_path] + cleanup_args
+
+                returncode, output, elapsed = run_phase(
+                    'cleanup', cleanup_args,
+                    project_path, max_turns=max_turns, max_review_cycles=max_review_cycles,
+                )
+
+                cleanup_succeeded = (returncode == 0)
+                if not cleanup_succeeded:
+                    stream_progress('Cleanup', f'Warning: Cleanup phase failed (exit={returncode})')
+                    # Don't fail the whole sprint item for cleanup issues
+
+                # Step 5: Reflect + consolidate in one call (skip if --skip-reflection).
+                # The plan, research and review are all final, so one session covers
+                # what used to be two micro-reflections and a consolidation.
+                if not skip_reflection:
+                    if not reflect_and_consolidate(plan_path, project_path,
+                                                   research_path=research_path,
+                                                   review_path=review_path):
+                        # Fall back to separate capture and integration passes
+                        micro_reflect('implement', plan_path, project_path,
+                                      research_path=research_path, review_path=review_path)
+                        consolidate_memory(project_path)
+
+                # Step 6: Update todo.md / done.md (only if cleanup didn't handle it)
+                if not cleanup_succeeded:
+                    update_todo_done(next_item, plan_path, project_path)
+
+                result.completed = True
+                consecutive_failures = 0
+
+            except RuntimeError as e:
+                result.error = str(e)
+                result.completed = False
+                consecutive_failures += 1
+                stream_progress('Error', f'Item failed: {e}')
+
+            except Exception as e:
+                result.error = f'Unexpected error: {e}'
+                result.completed = False
+                consecutive_failures += 1
+                stream_progress('Error', f'Unexpected: {e}')
+
+            results.append(result)
+
+            # Check for 3 consecutive failures
+            if consecutive_failures >= 3:
+                stream_progress('Sprint', 'Stopping: 3 consecutive failures')
+                break
 
-        # Checkpoint
-        if not show_checkpoint(result, item_count):
-            stream_progress('Sprint', 'User requested stop')
-            break
+            # Enrich the next item in the background while the checkpoint waits
+            # for the user. todo.md, done.md and decisions.md are final by now.
+            if not (max_items > 0 and item_count >= max_items):
+                upcoming = find_next_actionable(_cached_parse_todo(todo_path), done_path)
+                if upcoming is not None:
+                    proc = prefetch_enrichment(upcoming, project_path)
+                    if proc is not None:
+                        prefetched = (upcoming.text, proc)
+
+            # Checkpoint
+            if not show_checkpoint(result, item_count):
+                stream_progress('Sprint', 'User requested stop')
+                break
+    finally:
+        # Stop a prefetch nobody will use instead of letting it run on (and bill)
+        if prefetched:
+            stop_process_group(prefetched[1])
+        # A sync still running at the end has no phase left to speed up
+        if warmup is not None:
+            stop_process_group(warmup)
 
     return results
 
@@ -816,11 +1097,14 @@ Examples:
     try:
         total_start = time.time()
 
+        # Resolve once: every phase, helper path and cwd= below derives from it
+        project_path = str(Path(args.project).resolve())
+
         print_phase_header('Sprint Runner')
-        stream_progress('Sprint', f'Project: {os.path.abspath(args.project)}')
+        stream_progress('Sprint', f'Project: {project_path}')
 
         results = run_sprint(
-            project_path=args.project,
+            project_path=project_path,
             max_items=args.max_items,
             max_turns=args.max_turns,
             max_review_cycles=args.max_review_cycles,
@@ -835,13 +1119,13 @@ Examples:
         failed = sum(1 for r in results if not r.completed and r.error)
         completed_label = 'Previewed' if args.dry_run else 'Completed'
 
-        print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}", file=sys.stderr, flush=True)
+        print(f"\n{_SEPARATOR}", file=sys.stderr, flush=True)
         print(f"\n{Fore.GREEN}{Style.BRIGHT}  Sprint Summary{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
         print(f"  Items processed: {len(results)}", file=sys.stderr, flush=True)
         print(f"  {completed_label + ':':15s}{completed}", file=sys.stderr, flush=True)
         print(f"  {'Failed:':15s}{failed}", file=sys.stderr, flush=True)
         print(f"  Total time:      {format_duration(total_elapsed)}", file=sys.stderr, flush=True)
-        print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}\n", file=sys.stderr, flush=True)
+        print(f"\n{_SEPARATOR}\n", file=sys.stderr, flush=True)
 
         if args.json:
             output = {
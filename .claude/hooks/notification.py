@@ -35,8 +35,10 @@ def main() -> None:
         parser.add_argument('--notify', action='store_true', help='Enable audio notifications')
         args = parser.parse_args()
 
-        # Consume stdin (required by hook protocol)
-        sys.stdin.read()
+        # Consume stdin (required by hook protocol). The payload is unused, so
+        # drain the raw bytes instead of decoding them; exiting without
+        # draining could leave Claude writing into a closed pipe.
+        sys.stdin.buffer.read()
 
         if args.notify and is_audio_enabled():
             debug_log("Playing notification audio")
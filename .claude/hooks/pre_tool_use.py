@@ -52,7 +52,6 @@ import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple
 
 # Import settings loader for Layer 2
 sys.path.insert(0, str(Path(__file__).parent))
@@ -66,6 +65,14 @@ DEBUG = os.environ.get('CLAUDE_HOOKS_DEBUG', '').lower() in ('1', 'true')
 # Disables: rm -rf, fork bombs, disk writes, path escape
 CONTAINER_MODE = os.environ.get('CLAUDE_CONTAINER_MODE', '').lower() in ('1', 'true')
 
+
+def combine_patterns(patterns: list[re.Pattern]) -> re.Pattern:
+    """Combine patterns into one alternation, keeping each one's IGNORECASE flag."""
+    return re.compile('|'.join(
+        f"(?{'i' if p.flags & re.IGNORECASE else ''}:{p.pattern})" for p in patterns
+    ))
+
+
 # Pre-compiled regex patterns for performance
 DANGEROUS_RM_PATTERNS = [
     re.compile(r'\brm\s+.*-[a-z]*r[a-z]*f'),  # rm -rf, rm -fr, rm -Rf, etc.
@@ -178,6 +185,48 @@ SENSITIVE_FILE_PATTERNS = [
     (re.compile(r'\.tfstate$'), 'Terraform state file'),
 ]
 
+# Each Bash pattern list combined into one alternation, so a command costs one
+# search per category; the list itself is only walked to name a match
+DANGEROUS_RM_RE = combine_patterns(DANGEROUS_RM_PATTERNS)
+DANGEROUS_RM_PATH_RE = combine_patterns(DANGEROUS_RM_PATH_PATTERNS)
+FORK_BOMB_RE = combine_patterns(FORK_BOMB_PATTERNS)
+DANGEROUS_GIT_RE = combine_patterns(DANGEROUS_GIT_PATTERNS)
+DANGEROUS_DISK_RE = combine_patterns(DANGEROUS_DISK_PATTERNS)
+ENV_ACCESS_RE = combine_patterns(ENV_ACCESS_PATTERNS)
+
+NETWORK_ESCAPE_CHECKS = [
+    (combine_patterns(patterns), patterns, message)
+    for patterns, message in [
+        (CLOUD_METADATA_PATTERNS, "Cloud metadata access blocked (SSRF)"),
+        (PIPE_TO_SHELL_PATTERNS, "Piping remote content to shell is blocked"),
+        (REVERSE_SHELL_PATTERNS, "Reverse shell attempt blocked"),
+        (CONTAINER_ESCAPE_PATTERNS, "Container escape attempt blocked"),
+        (CREDENTIAL_EXFIL_PATTERNS, "Credential exfiltration blocked"),
+        (CRYPTO_MINING_PATTERNS, "Crypto mining blocked"),
+    ]
+]
+
+# Literals of which every Bash pattern above needs at least one, as it appears
+# in the normalized command (lowercased, whitespace collapsed). A command with
+# none of them can't match, so the regex checks are skipped. Keep in sync when
+# adding a pattern.
+BASH_PATTERN_HINTS = (
+    'rm', 'git', '.env', 'fork', ':|:', './', '/dev/', 'mkfs', 'curl', 'wget',
+    'base64', 'nc', 'socket', 'nsenter', 'docker', '/etc/shadow', 'xmrig',
+)
+
+# Literal pieces of SENSITIVE_FILE_PATTERNS, checked in C before any regex runs.
+# Every pattern must be covered here: a path matching none of these is not
+# sensitive, and one that does is confirmed (and described) by the list above.
+SENSITIVE_SUFFIXES = (
+    '.pem', '.key', '.p12', '.pfx', '.vault-token', '.htpasswd', '.pgpass',
+    '.my.cnf', '.docker/config.json', '.tfstate',
+    *(f'{name}.{ext}' for name in ('credentials', 'secret', 'secrets')
+      for ext in ('json', 'yaml', 'yml', 'xml', 'ini', 'conf')),
+)
+SENSITIVE_SUBSTRINGS = ('.kube/config', '.aws/credentials', '.ssh/', '.gnupg/', '.netrc', '.npmrc', '.pypirc')
+SERVICE_ACCOUNT_PATTERN = re.compile(r'service[_-]account.*\.json$')
+
 # Exact filename matches for sensitive files
 SENSITIVE_FILES = {
     '.env',
@@ -191,11 +240,33 @@ SENSITIVE_FILES = {
 # Allowed .env variants
 ALLOWED_ENV_FILES = {'.env.sample', '.env.example', '.env.template'}
 
+# Tools with file path checks, and every tool any layer checks (the same set
+# load_deny_patterns keeps settings.json rules for); others are only audited
+FILE_TOOLS = frozenset({'Read', 'Edit', 'MultiEdit', 'Write', 'Glob', 'Grep'})
+CHECKED_TOOLS = FILE_TOOLS | {'Bash'}
+
 
-def debug_log(message: str) -> None:
-    """Log debug message if debug mode is enabled."""
-    if DEBUG:
+# Picked once at import, so calls on the hot path don't re-check DEBUG
+if DEBUG:
+    def debug_log(message: str) -> None:
+        """Log debug message to stderr."""
         print(f"[DEBUG] {message}", file=sys.stderr)
+else:
+    def debug_log(message: str) -> None:
+        """Debug mode is disabled: discard the message."""
+
+
+def find_match(union: re.Pattern, patterns: list[re.Pattern], text: str) -> re.Pattern | None:
+    """Return the first of patterns that matches text, searching the union first.
+
+    Only debug output names the individual pattern, so without DEBUG the
+    matching union is returned rather than searching the list again.
+    """
+    if union.search(text) is None:
+        return None
+    if not DEBUG:
+        return union
+    return next(pattern for pattern in patterns if pattern.search(text))
 
 
 def respond_deny(reason: str) -> None:
@@ -215,10 +286,14 @@ def audit_log(tool_name: str, tool_input: dict, decision: str, reason: str, mode
     """Append audit entry to JSONL log file."""
     try:
         log_dir = Path(os.environ.get('CLAUDE_PROJECT_DIR', os.getcwd())) / "memories" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
         log_path = log_dir / "hook-audit.jsonl"
 
-        # Truncate tool_input to avoid massive log entries
+        # Truncate tool_input to avoid massive log entries. Clip long string
+        # values (Write content, Edit strings) first so they aren't encoded in
+        # full; a clipped value still encodes past the cut-off, so the summary
+        # is the same as cutting the full dump.
+        if isinstance(tool_input, dict):
+            tool_input = {k: v[:256] if isinstance(v, str) else v for k, v in tool_input.items()}
         summary = json.dumps(tool_input)
         if len(summary) > 256:
             summary = summary[:253] + "..."
@@ -233,84 +308,101 @@ def audit_log(tool_name: str, tool_input: dict, decision: str, reason: str, mode
             "mode": mode,
         }
 
-        with open(log_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        # One line appended per call; the directory is only created on the
+        # first write, not checked on every tool invocation
+        line = json.dumps(entry) + "\n"
+        try:
+            f = open(log_path, "a")
+        except FileNotFoundError:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            f = open(log_path, "a")
+        with f:
+            f.write(line)
     except Exception:
         pass  # Never let logging break the hook
 
 
-def is_dangerous_rm_command(command: str) -> bool:
+def normalize_command(command: str) -> str:
+    """Lowercase a command and collapse its whitespace for pattern matching."""
+    return ' '.join(command.lower().split())
+
+
+def is_benign_command(normalized: str) -> bool:
+    """True when a normalized command contains none of BASH_PATTERN_HINTS.
+
+    Limited to ASCII: with IGNORECASE, re also folds a few non-ASCII letters
+    (e.g. 'ſ' to 's') that a plain substring test would not.
+    """
+    return normalized.isascii() and not any(hint in normalized for hint in BASH_PATTERN_HINTS)
+
+
+def is_dangerous_rm_command(command: str, normalized: str | None = None) -> bool:
     """
     Comprehensive detection of dangerous rm commands.
     Matches various forms of rm -rf and similar destructive patterns.
     """
-    normalized = ' '.join(command.lower().split())
+    if normalized is None:
+        normalized = normalize_command(command)
 
     # Check standard rm -rf variations
-    for pattern in DANGEROUS_RM_PATTERNS:
-        if pattern.search(normalized):
-            debug_log(f"Matched dangerous rm pattern: {pattern.pattern}")
-            return True
+    pattern = find_match(DANGEROUS_RM_RE, DANGEROUS_RM_PATTERNS, normalized)
+    if pattern:
+        debug_log(f"Matched dangerous rm pattern: {pattern.pattern}")
+        return True
 
     # Check for rm with recursive flag targeting dangerous paths
     if RM_RECURSIVE_PATTERN.search(normalized):
-        for pattern in DANGEROUS_RM_PATH_PATTERNS:
-            if pattern.search(normalized):
-                debug_log(f"Matched dangerous rm path pattern: {pattern.pattern}")
-                return True
+        pattern = find_match(DANGEROUS_RM_PATH_RE, DANGEROUS_RM_PATH_PATTERNS, normalized)
+        if pattern:
+            debug_log(f"Matched dangerous rm path pattern: {pattern.pattern}")
+            return True
 
     return False
 
 
 def is_fork_bomb(command: str) -> bool:
     """Detect fork bomb patterns."""
-    for pattern in FORK_BOMB_PATTERNS:
-        if pattern.search(command):
-            debug_log(f"Matched fork bomb pattern: {pattern.pattern}")
-            return True
+    pattern = find_match(FORK_BOMB_RE, FORK_BOMB_PATTERNS, command)
+    if pattern:
+        debug_log(f"Matched fork bomb pattern: {pattern.pattern}")
+        return True
     return False
 
 
-def is_dangerous_git_command(command: str) -> bool:
+def is_dangerous_git_command(command: str, normalized: str | None = None) -> bool:
     """Detect dangerous git commands."""
-    normalized = ' '.join(command.lower().split())
+    if normalized is None:
+        normalized = normalize_command(command)
 
-    for pattern in DANGEROUS_GIT_PATTERNS:
-        if pattern.search(normalized):
-            debug_log(f"Matched dangerous git pattern: {pattern.pattern}")
-            return True
+    pattern = find_match(DANGEROUS_GIT_RE, DANGEROUS_GIT_PATTERNS, normalized)
+    if pattern:
+        debug_log(f"Matched dangerous git pattern: {pattern.pattern}")
+        return True
     return False
 
 
-def is_dangerous_disk_write(command: str) -> bool:
+def is_dangerous_disk_write(command: str, normalized: str | None = None) -> bool:
     """Detect dangerous disk write operations."""
-    normalized = ' '.join(command.lower().split())
+    if normalized is None:
+        normalized = normalize_command(command)
 
-    for pattern in DANGEROUS_DISK_PATTERNS:
-        if pattern.search(normalized):
-            debug_log(f"Matched dangerous disk pattern: {pattern.pattern}")
-            return True
+    pattern = find_match(DANGEROUS_DISK_RE, DANGEROUS_DISK_PATTERNS, normalized)
+    if pattern:
+        debug_log(f"Matched dangerous disk pattern: {pattern.pattern}")
+        return True
     return False
 
 
-def is_network_escape_threat(command: str) -> tuple[bool, str]:
+def is_network_escape_threat(command: str, normalized: str | None = None) -> tuple[bool, str]:
     """Detect network-based threats that can escape a container."""
-    normalized = ' '.join(command.lower().split())
+    if normalized is None:
+        normalized = normalize_command(command)
 
-    checks = [
-        (CLOUD_METADATA_PATTERNS, "Cloud metadata access blocked (SSRF)"),
-        (PIPE_TO_SHELL_PATTERNS, "Piping remote content to shell is blocked"),
-        (REVERSE_SHELL_PATTERNS, "Reverse shell attempt blocked"),
-        (CONTAINER_ESCAPE_PATTERNS, "Container escape attempt blocked"),
-        (CREDENTIAL_EXFIL_PATTERNS, "Credential exfiltration blocked"),
-        (CRYPTO_MINING_PATTERNS, "Crypto mining blocked"),
-    ]
-
-    for patterns, message in checks:
-        for pattern in patterns:
-            if pattern.search(normalized):
-                debug_log(f"Matched network/escape pattern: {pattern.pattern}")
-                return True, message
+    for union, patterns, message in NETWORK_ESCAPE_CHECKS:
+        pattern = find_match(union, patterns, normalized)
+        if pattern:
+            debug_log(f"Matched network/escape pattern: {pattern.pattern}")
+            return True, message
 
     return False, ""
 
@@ -321,7 +413,8 @@ def is_sensitive_file(file_path: str) -> tuple[bool, str | None]:
         return False, None
 
     path_lower = file_path.lower()
-    basename = os.path.basename(path_lower)
+    # Same as os.path.basename on POSIX, without the call (rfind is -1 for no '/')
+    basename = path_lower[path_lower.rfind('/') + 1:]
 
     # In container mode, .ssh access is allowed (only explicit keys are mounted)
     if CONTAINER_MODE and '.ssh/' in path_lower:
@@ -336,6 +429,13 @@ def is_sensitive_file(file_path: str) -> tuple[bool, str | None]:
         debug_log(f"Matched sensitive file: {basename}")
         return True, f"Access to {basename} files is prohibited"
 
+    # Most paths match no pattern: rule that out with the literal checks first
+    # ('$' also matches before a trailing newline, hence the rstrip)
+    if not (path_lower.rstrip('\n').endswith(SENSITIVE_SUFFIXES)
+            or any(part in path_lower for part in SENSITIVE_SUBSTRINGS)
+            or SERVICE_ACCOUNT_PATTERN.search(path_lower)):
+        return False, None
+
     # Check pattern matches
     for pattern, description in SENSITIVE_FILE_PATTERNS:
         if pattern.search(path_lower):
@@ -351,15 +451,13 @@ def is_path_escape(file_path: str, project_dir: str) -> tuple[bool, str | None]:
         return False, None
 
     try:
-        # Resolve to absolute paths
-        abs_path = Path(file_path).resolve()
-        abs_project = Path(project_dir).resolve()
+        # Resolve to absolute paths (realpath gives strings, no Path objects)
+        path_str = os.path.realpath(file_path)
+        project_str = os.path.realpath(project_dir)
 
         # Check if path is within project (using proper prefix check)
         # CVE-2025-54794: Must check with trailing separator to prevent
         # /project matching /project_malicious
-        project_str = str(abs_project)
-        path_str = str(abs_path)
 
         if not (path_str == project_str or path_str.startswith(project_str + os.sep)):
             debug_log(f"Path escape detected: {path_str} not in {project_str}")
@@ -406,28 +504,33 @@ def check_against_settings_deny(
 
 def check_bash_command(command: str) -> str | None:
     """Check bash command for dangerous patterns."""
-    if is_dangerous_rm_command(command):
+    # Normalized once for all the checks that match lowercased, single-spaced text
+    normalized = normalize_command(command)
+    if is_benign_command(normalized):
+        return None
+
+    if is_dangerous_rm_command(command, normalized):
         return "Dangerous rm command detected"
 
     if is_fork_bomb(command):
         return "Fork bomb detected"
 
-    if is_dangerous_git_command(command):
+    if is_dangerous_git_command(command, normalized):
         return "Git push is not allowed — push manually"
 
-    if is_dangerous_disk_write(command):
+    if is_dangerous_disk_write(command, normalized):
         return "Dangerous disk write operation detected"
 
     # Check for network/escape threats
-    is_threat, reason = is_network_escape_threat(command)
+    is_threat, reason = is_network_escape_threat(command, normalized)
     if is_threat:
         return reason
 
     # Check for .env access in bash commands
-    for pattern in ENV_ACCESS_PATTERNS:
-        if pattern.search(command):
-            debug_log(f"Matched env access pattern: {pattern.pattern}")
-            return "Access to .env files is prohibited"
+    pattern = find_match(ENV_ACCESS_RE, ENV_ACCESS_PATTERNS, command)
+    if pattern:
+        debug_log(f"Matched env access pattern: {pattern.pattern}")
+        return "Access to .env files is prohibited"
 
     return None
 
@@ -463,17 +566,21 @@ def check_file_operation(tool_name: str, tool_input: dict, project_dir: str) ->
 
 def check_bash_command_container(command: str) -> str | None:
     """Check bash command in container mode (git, .env, and network escape)."""
-    if is_dangerous_git_command(command):
+    normalized = normalize_command(command)
+    if is_benign_command(normalized):
+        return None
+
+    if is_dangerous_git_command(command, normalized):
         return "Git push is not allowed — push manually"
 
     # Check for .env access in bash commands
-    for pattern in ENV_ACCESS_PATTERNS:
-        if pattern.search(command):
-            debug_log(f"Matched env access pattern: {pattern.pattern}")
-            return "Access to .env files is prohibited"
+    pattern = find_match(ENV_ACCESS_RE, ENV_ACCESS_PATTERNS, command)
+    if pattern:
+        debug_log(f"Matched env access pattern: {pattern.pattern}")
+        return "Access to .env files is prohibited"
 
     # Check for network/escape threats (these escape the container boundary)
-    is_threat, reason = is_network_escape_threat(command)
+    is_threat, reason = is_network_escape_threat(command, normalized)
     if is_threat:
         return reason
 
@@ -514,6 +621,11 @@ def main() -> None:
 
         debug_log(f"Checking tool: {tool_name}")
 
+        # Nothing to check: skip loading settings.json and go straight to the log
+        if tool_name not in CHECKED_TOOLS:
+            audit_log(tool_name, tool_input, "allow", "", mode)
+            sys.exit(0)
+
         # Layer 2: Load settings.json deny patterns (enforced in ALL modes)
         deny_patterns = load_deny_patterns(project_dir)
 
@@ -528,7 +640,7 @@ def main() -> None:
                     audit_log(tool_name, tool_input, "deny", error, mode)
                     respond_deny(error)
 
-            if tool_name in ['Read', 'Edit', 'MultiEdit', 'Write', 'Glob', 'Grep']:
+            if tool_name in FILE_TOOLS:
                 error = check_file_operation_container(tool_name, tool_input)
                 if error:
                     audit_log(tool_name, tool_input, "deny", error, mode)
@@ -554,7 +666,7 @@ def main() -> None:
                 respond_deny(error)
 
         # Check file operations (including Glob and Grep)
-        if tool_name in ['Read', 'Edit', 'MultiEdit', 'Write', 'Glob', 'Grep']:
+        if tool_name in FILE_TOOLS:
             error = check_file_operation(tool_name, tool_input, project_dir)
             if error:
                 audit_log(tool_name, tool_input, "deny", error, mode)
@@ -37,8 +37,10 @@ def main() -> None:
                           help='Play audio on session end')
         args = parser.parse_args()
 
-        # Consume stdin (required by hook protocol)
-        sys.stdin.read()
+        # Consume stdin (required by hook protocol). The payload is unused, so
+        # drain the raw bytes instead of decoding them; exiting without
+        # draining could leave Claude writing into a closed pipe.
+        sys.stdin.buffer.read()
 
         # Play session end audio if requested and enabled
         if args.announce and is_audio_enabled():
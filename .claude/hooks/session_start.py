@@ -13,7 +13,6 @@ import shutil
 import subprocess
 import sys
 from datetime import datetime
-from pathlib import Path
 
 # Debug mode for troubleshooting
 DEBUG = os.environ.get('CLAUDE_HOOKS_DEBUG', '').lower() in ('1', 'true')
@@ -109,16 +108,18 @@ def load_development_context(source: str) -> str:
     ]
 
     for file_path in context_files:
-        if Path(file_path).exists():
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        context_parts.append(f"\n--- Content from {file_path} ---")
-                        context_parts.append(content[:1000])  # Limit to first 1000 chars
-                        debug_log(f"Loaded context from: {file_path}")
-            except Exception as e:
-                debug_log(f"Error loading {file_path}: {e}")
+        # Open directly rather than stat first; most of these are usually absent
+        try:
+            with open(file_path, 'r') as f:
+                content = f.read().strip()
+                if content:
+                    context_parts.append(f"\n--- Content from {file_path} ---")
+                    context_parts.append(content[:1000])  # Limit to first 1000 chars
+                    debug_log(f"Loaded context from: {file_path}")
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            debug_log(f"Error loading {file_path}: {e}")
 
     # Add recent issues if available
     issues = get_recent_issues()
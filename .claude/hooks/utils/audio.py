@@ -9,8 +9,6 @@ Set CLAUDE_HOOKS_DEBUG=1 to enable debug logging.
 from __future__ import annotations
 
 import os
-import random
-import subprocess
 import sys
 from pathlib import Path
 
@@ -56,25 +54,29 @@ def get_project_root() -> Path:
 def load_env_file() -> None:
     """Load environment variables from .env file in project root."""
     env_path = get_project_root() / ".env"
-    if env_path.exists():
-        try:
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip("'\"")
-                        if key not in os.environ:  # Don't override existing env vars
-                            os.environ[key] = value
-            debug_log(f"Loaded env file: {env_path}")
-        except Exception as e:
-            debug_log(f"Error loading env file: {e}")
+    try:
+        # Open directly rather than stat first; a missing .env is the common case
+        with open(env_path) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, value = line.split("=", 1)
+                    key = key.strip()
+                    value = value.strip().strip("'\"")
+                    if key not in os.environ:  # Don't override existing env vars
+                        os.environ[key] = value
+        debug_log(f"Loaded env file: {env_path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        debug_log(f"Error loading env file: {e}")
 
 
 def is_audio_enabled() -> bool:
     """Check if audio is enabled via environment variable or .env file. Disabled by default."""
-    load_env_file()
+    # .env never overrides the environment, so only look for it when unset
+    if "CLAUDE_AUDIO_ENABLED" not in os.environ:
+        load_env_file()
     enabled = os.environ.get("CLAUDE_AUDIO_ENABLED", "").lower() in ("1", "true", "yes")
     debug_log(f"Audio enabled: {enabled}")
     return enabled
@@ -94,6 +96,9 @@ def get_random_audio_file(category: str = "notification") -> Path | None:
         debug_log(f"No audio files in: {audio_dir}")
         return None
 
+    # Imported here: audio is off by default, so most hook runs never need it
+    import random
+
     selected = random.choice(audio_files)
     debug_log(f"Selected audio file: {selected}")
     return selected
@@ -106,14 +111,17 @@ def play_audio(category: str = "notification") -> None:
         if not audio_file:
             return
 
-        subprocess.run(
+        import subprocess
+
+        # Fire and forget: the hook returns while the clip plays, and the
+        # player's own session keeps it alive after the hook process exits
+        subprocess.Popen(
             ["afplay", str(audio_file)],
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-            timeout=10
+            start_new_session=True,
         )
-        debug_log(f"Played audio: {audio_file}")
-    except subprocess.TimeoutExpired:
-        debug_log("Audio playback timed out")
+        debug_log(f"Started audio: {audio_file}")
     except Exception as e:
         debug_log(f"Error playing audio: {e}")
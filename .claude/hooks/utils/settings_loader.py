@@ -24,10 +24,8 @@ def load_deny_patterns(project_dir: str) -> dict[str, list[re.Pattern]]:
         "Glob": [], "Grep": [], "MultiEdit": [],
     }
 
+    # No exists() check first: a missing file is just another OSError here
     settings_path = Path(project_dir) / ".claude" / "settings.json"
-    if not settings_path.exists():
-        return patterns
-
     try:
         with open(settings_path) as f:
             settings = json.load(f)